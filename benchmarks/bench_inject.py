@@ -0,0 +1,110 @@
+"""Compares compiled resolution plans with the previous per-call resolution of `@inject` wrappers.
+
+Run from the repository root with `python -m benchmarks.bench_inject`.
+"""
+import timeit
+from functools import wraps
+from typing import Any, Dict, Tuple
+
+from kink import Container, inject
+from kink.inject import Parameter, Undefined, _inspect_function_arguments
+
+
+def _legacy_resolve_function_kwargs(
+    alias_map: Dict[str, str],
+    parameters_name: Tuple[str, ...],
+    parameters: Dict[str, Parameter],
+    container: Container,
+) -> Dict[str, Any]:
+    resolved_kwargs = {}
+    for name in parameters_name:
+        if name in alias_map and alias_map[name] in container:
+            resolved_kwargs[name] = container[alias_map[name]]
+            continue
+
+        if name in container:
+            resolved_kwargs[name] = container[name]
+            continue
+
+        if parameters[name].type in container:
+            resolved_kwargs[name] = container[parameters[name].type]
+            continue
+
+        if parameters[name].default is not Undefined:
+            resolved_kwargs[name] = parameters[name].default
+
+    return resolved_kwargs
+
+
+def _legacy_inject(service, container: Container, binding: Dict[str, Any]):
+    """Wrapper as it was before resolution plans were introduced."""
+    parameters_name, parameters = _inspect_function_arguments(service)
+
+    @wraps(service)
+    def _decorated(*args, **kwargs):
+        if len(args) == len(parameters_name):
+            return service(*args, **kwargs)
+
+        if parameters_name == tuple(kwargs.keys()):
+            return service(**kwargs)
+
+        passed_kwargs = {**kwargs}
+        for key, value in enumerate(args):
+            passed_kwargs[parameters_name[key]] = value
+
+        if set(passed_kwargs.keys()) == set(parameters_name):
+            return service(**passed_kwargs)
+
+        resolved_kwargs = _legacy_resolve_function_kwargs(binding, parameters_name, parameters, container)
+        return service(**{**resolved_kwargs, **passed_kwargs})
+
+    return _decorated
+
+
+class Database:
+    ...
+
+
+class Cache:
+    ...
+
+
+def _build_container() -> Container:
+    container = Container()
+    container["name"] = "Bob"
+    container["region"] = "eu"
+    container[Database] = Database()
+    container[Cache] = lambda di: Cache()
+    container.factories["request_id"] = lambda di: 1
+    container["real_timeout"] = 10
+    return container
+
+
+def handler(name: str, region: str, db: Database, cache: Cache, request_id: int, timeout: int, retries: int = 3):
+    return name, region, db, cache, request_id, timeout, retries
+
+
+def main(number: int = 100_000) -> None:
+    container = _build_container()
+    binding = {"timeout": "real_timeout"}
+
+    legacy = _legacy_inject(handler, container, binding)
+    planned = inject(handler, bind=binding, container=container)
+    assert legacy() == planned()
+
+    cases = {
+        "no arguments passed": lambda f: f(),
+        "some arguments passed": lambda f: f("Tom", region="us"),
+    }
+    for case, call in cases.items():
+        legacy_time = min(timeit.repeat(lambda: call(legacy), number=number, repeat=5))
+        planned_time = min(timeit.repeat(lambda: call(planned), number=number, repeat=5))
+        print(
+            f"{case:<24} legacy: {legacy_time / number * 1e6:7.3f}us  "
+            f"planned: {planned_time / number * 1e6:7.3f}us  "
+            f"speedup: {legacy_time / planned_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measures import time of a synthetic module with thousands of `@inject` decorated services, eager vs deferred inspection.
+
+Run from the repository root with `python -m benchmarks.bench_startup`.
+"""
+import sys
+import time
+import types
+
+from kink import Container, inject
+
+
+def _synthetic_source(count: int, defer_inspection: bool) -> str:
+    lines = ["from typing import Optional", ""]
+    for index in range(count):
+        lines += [
+            f"class Dependency{index}:",
+            "    ...",
+            "",
+            f"@inject(container=container, defer_inspection={defer_inspection})",
+            f"class Service{index}:",
+            f"    def __init__(self, dependency: 'Dependency{index}', name: str, retries: int = 3):",
+            "        self.dependency = dependency",
+            "",
+            f"@inject(container=container, defer_inspection={defer_inspection})",
+            f"def handler_{index}(service: Service{index}, request_id: Optional[int] = None, timeout: float = 1.0):",
+            "    return service",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def _import(source: str, name: str) -> float:
+    module = types.ModuleType(name)
+    module.__dict__.update(inject=inject, container=Container())
+    sys.modules[name] = module
+    code = compile(source, name, "exec")
+
+    start = time.perf_counter()
+    exec(code, module.__dict__)
+    elapsed = time.perf_counter() - start
+
+    del sys.modules[name]
+    return elapsed
+
+
+def main(count: int = 5000) -> None:
+    for defer_inspection in (False, True):
+        source = _synthetic_source(count, defer_inspection)
+        elapsed = min(_import(source, f"_synthetic_{defer_inspection}") for _ in range(3))
+        print(f"{'deferred' if defer_inspection else 'eager':<8} {count} classes and {count} functions: {elapsed * 1e3:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
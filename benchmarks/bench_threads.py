@@ -0,0 +1,69 @@
+"""Measures lambda singleton construction and memoized reads under thread contention.
+
+Run from the repository root with `python -m benchmarks.bench_threads`.
+"""
+import sys
+import time
+from threading import Barrier, Thread
+from typing import Callable
+
+from kink import Container
+
+
+def _contend(threads_count: int, target: Callable[[], None]) -> float:
+    barrier = Barrier(threads_count + 1)
+
+    def _worker() -> None:
+        barrier.wait()
+        target()
+
+    threads = [Thread(target=_worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def cold_start(threads_count: int, construction_time: float = 0.005) -> None:
+    constructions = []
+
+    def _build(di: Container) -> object:
+        time.sleep(construction_time)
+        constructions.append(1)
+        return object()
+
+    container = Container()
+    container["pool"] = lambda di: _build(di)
+
+    elapsed = _contend(threads_count, lambda: container["pool"])
+    print(f"cold key, {threads_count:>3} threads: {elapsed * 1e3:8.2f}ms, constructions: {len(constructions)}")
+
+
+def warm_reads(threads_count: int, reads: int = 100_000) -> None:
+    container = Container()
+    container["pool"] = lambda di: object()
+    container["pool"]
+
+    def _read() -> None:
+        for _ in range(reads):
+            container["pool"]
+
+    elapsed = _contend(threads_count, _read)
+    total = threads_count * reads
+    print(f"warm key, {threads_count:>3} threads: {elapsed / total * 1e9:8.1f}ns per read ({total} reads)")
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    for threads_count in (1, 4, 16, 64):
+        cold_start(threads_count)
+    for threads_count in (1, 4, 16):
+        warm_reads(threads_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Benchmark suite for container lookups and overhead of injected calls.
+
+Run from the repository root with `python -m benchmarks.suite`. Results can be stored as JSON with
+`--output results.json` and compared with a previous run with `--compare previous.json`.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+from kink import Container, inject
+
+Benchmark = Callable[[], Callable[[], Any]]
+
+_BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark, a function preparing and returning the callable to measure."""
+
+    def _register(setup: Benchmark) -> Benchmark:
+        _BENCHMARKS[name] = setup
+        return setup
+
+    return _register
+
+
+class Database:
+    ...
+
+
+class Cache:
+    ...
+
+
+class IPlugin:
+    ...
+
+
+def _bootstrap(size: int = 0) -> Container:
+    container = Container()
+    container["name"] = "Bob"
+    container["timeout"] = 10
+    container[Database] = lambda di: Database()
+    container[Cache] = Cache()
+    container.factories["request_id"] = lambda di: 1
+    for index in range(5):
+        plugin = type(f"Plugin{index}", (IPlugin,), {})
+        container[plugin] = plugin()
+        container.add_alias(IPlugin, plugin)
+    for index in range(size):
+        container[f"service_{index}"] = index
+    return container
+
+
+@benchmark("lookup.name")
+def _lookup_name() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: container["name"]
+
+
+@benchmark("lookup.type")
+def _lookup_type() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: container[Database]
+
+
+@benchmark("lookup.factory")
+def _lookup_factory() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: container["request_id"]
+
+
+@benchmark("lookup.alias")
+def _lookup_alias() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: container[IPlugin]
+
+
+@benchmark("lookup.optional")
+def _lookup_optional() -> Callable[[], Any]:
+    container = _bootstrap()
+    key = Optional[Database]
+    return lambda: container[key]
+
+
+@benchmark("lookup.alias_list")
+def _lookup_alias_list() -> Callable[[], Any]:
+    container = _bootstrap()
+    key = List[IPlugin]
+    return lambda: container[key]
+
+
+@benchmark("lookup.miss")
+def _lookup_miss() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: container.get("missing")
+
+
+@benchmark("lookup.contains_miss")
+def _lookup_contains_miss() -> Callable[[], Any]:
+    container = _bootstrap()
+    return lambda: "missing" in container
+
+
+@benchmark("lookup.large_container")
+def _lookup_large_container() -> Callable[[], Any]:
+    container = _bootstrap(10_000)
+    return lambda: container["service_5000"]
+
+
+@benchmark("lookup.large_container_frozen")
+def _lookup_large_container_frozen() -> Callable[[], Any]:
+    container = _bootstrap(10_000).freeze()
+    return lambda: container["service_5000"]
+
+
+def _handler(container: Container) -> Callable[..., Any]:
+    @inject(container=container)
+    def handler(name: str, timeout: int, db: Database, cache: Cache, request_id: int, retries: int = 3) -> Any:
+        return name
+
+    return handler
+
+
+@benchmark("call.raw")
+def _call_raw() -> Callable[[], Any]:
+    def handler(name: str, timeout: int, db: Database, cache: Cache, request_id: int, retries: int = 3) -> Any:
+        return name
+
+    db, cache = Database(), Cache()
+    return lambda: handler("Bob", 10, db, cache, 1, 3)
+
+
+@benchmark("call.no_arguments")
+def _call_no_arguments() -> Callable[[], Any]:
+    handler = _handler(_bootstrap())
+    return lambda: handler()
+
+
+@benchmark("call.all_arguments")
+def _call_all_arguments() -> Callable[[], Any]:
+    handler = _handler(_bootstrap())
+    db, cache = Database(), Cache()
+    return lambda: handler("Bob", 10, db, cache, 1, 3)
+
+
+@benchmark("call.positional_arguments")
+def _call_positional_arguments() -> Callable[[], Any]:
+    handler = _handler(_bootstrap())
+    return lambda: handler("Tom", 5)
+
+
+@benchmark("call.partial_arguments")
+def _call_partial_arguments() -> Callable[[], Any]:
+    handler = _handler(_bootstrap())
+    return lambda: handler("Tom", timeout=5)
+
+
+@benchmark("call.constructor")
+def _call_constructor() -> Callable[[], Any]:
+    container = _bootstrap()
+
+    @inject(container=container, use_factory=True)
+    class Repository:
+        def __init__(self, db: Database, cache: Cache, timeout: int):
+            self.db = db
+
+    return lambda: container[Repository]
+
+
+@benchmark("call.async")
+def _call_async() -> Callable[[], Any]:
+    container = _bootstrap()
+
+    @inject(container=container)
+    async def handler(name: str, timeout: int, db: Database, cache: Cache, request_id: int) -> Any:
+        return name
+
+    async def _batch() -> None:
+        for _ in range(100):
+            await handler()
+
+    loop = asyncio.new_event_loop()
+    # event loop overhead is amortised over a batch of awaited calls
+    return lambda: loop.run_until_complete(_batch())
+
+
+_BATCHED = {"call.async": 100}
+
+
+def _measure(setup: Benchmark, repeat: int, min_time: float) -> Dict[str, float]:
+    function = setup()
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    timings = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {"min_ns": min(timings) * 1e9, "max_ns": max(timings) * 1e9, "loops": number}
+
+
+def run(names: Optional[List[str]] = None, repeat: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    results = {}
+    for name, setup in _BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        result = _measure(setup, repeat, min_time)
+        batch = _BATCHED.get(name, 1)
+        result["min_ns"] /= batch
+        result["max_ns"] /= batch
+        results[name] = result
+
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def _print(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    previous = baseline["results"] if baseline else {}
+    for name, result in report["results"].items():
+        line = f"{name:<32} {result['min_ns']:10.1f}ns"
+        if name in previous:
+            line += f"  {result['min_ns'] / previous[name]['min_ns']:6.2f}x of baseline"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmarks", nargs="*", help="run only benchmarks with the given name prefixes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum time of a single repeat in seconds")
+    parser.add_argument("--output", help="store results as JSON in the given file, `-` for stdout")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    arguments = parser.parse_args()
+
+    report = run(arguments.benchmarks, arguments.repeat, arguments.min_time)
+
+    if arguments.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        return
+
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)
+    _print(report, baseline)
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,8 @@
 from .container import *
 from .inject import *
+from .instrumentation import *
+from .profiler import *
+from .graph import *
+from .lazy import *
+from .cache import *
+from .pool import *
@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Tuple
+from weakref import WeakValueDictionary
+
+_MISSING = object()
+
+
+class CachePolicy(ABC):
+    """Storage of memoized services registered with `container.set_cache_policy(key, policy)`.
+
+    A single policy can be shared by many keys of a container, for example to bound the number
+    of per tenant services kept in memory. Evicted services are created again on their next lookup.
+    """
+
+    @abstractmethod
+    def get(self, key: Any, default: Any = None) -> Any: ...
+
+    @abstractmethod
+    def __setitem__(self, key: Any, service: Any) -> None: ...
+
+    @abstractmethod
+    def pop(self, key: Any, default: Any = None) -> Any: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+
+class LRUPolicy(CachePolicy):
+    """Keeps at most `max_size` services, evicting the least recently used one."""
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError("Maximum size of the cache must be positive.")
+        self.max_size = max_size
+        self._services: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            service = self._services.get(key, _MISSING)
+            if service is _MISSING:
+                return default
+            self._services.move_to_end(key)
+            return service
+
+    def __setitem__(self, key: Any, service: Any) -> None:
+        with self._lock:
+            self._services[key] = service
+            self._services.move_to_end(key)
+            while len(self._services) > self.max_size:
+                self._services.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            return self._services.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._services.clear()
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+
+class TTLPolicy(CachePolicy):
+    """Keeps services for `ttl` seconds after their creation, so stale services get refreshed."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = monotonic):
+        if ttl <= 0:
+            raise ValueError("Time to live of cached services must be positive.")
+        self.ttl = ttl
+        self._clock = clock
+        self._services: Dict[Any, Tuple[Any, float]] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._services.get(key)
+        if entry is None:
+            return default
+        service, expires_at = entry
+        if self._clock() >= expires_at:
+            # another thread might have stored a fresh service meanwhile
+            if self._services.get(key) is entry:
+                self._services.pop(key, None)
+            return default
+        return service
+
+    def __setitem__(self, key: Any, service: Any) -> None:
+        self._services[key] = (service, self._clock() + self.ttl)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._services.pop(key, None)
+        if entry is None:
+            return default
+        return entry[0]
+
+    def clear(self) -> None:
+        self._services.clear()
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+
+class WeakPolicy(CachePolicy):
+    """Keeps services only as long as they are referenced elsewhere, services must support weak references."""
+
+    def __init__(self):
+        self._services: "WeakValueDictionary[Any, Any]" = WeakValueDictionary()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._services.get(key, default)
+
+    def __setitem__(self, key: Any, service: Any) -> None:
+        self._services[key] = service
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        return self._services.pop(key, default)
+
+    def clear(self) -> None:
+        self._services.clear()
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+
+__all__ = ["CachePolicy", "LRUPolicy", "TTLPolicy", "WeakPolicy"]
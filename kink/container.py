@@ -1,30 +1,263 @@
+import asyncio
+import weakref
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+from threading import Lock, RLock
+from time import perf_counter
 from types import LambdaType
-from typing import Any, Dict, Type, Union, Callable, List, overload, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
+from kink.cache import CachePolicy
+from kink.errors.frozen_container_error import FrozenContainerError
+from kink.errors.missing_services_error import MissingServicesError
+from kink.errors.resolver_error import ResolverError
 from kink.errors.service_error import ServiceError
-from kink.typing_support import is_optional, unpack_optional
+from kink.instrumentation import Instrumentation, instrument_construct, instrument_resolve
+from kink.pool import Pool
+from kink.typing_support import KEY_PLAIN, KEY_SEQUENCE, normalize_key
 
-_MISSING_SERVICE = object()
+if TYPE_CHECKING:
+    from kink.graph import DependencyGraph
+
+_MISSING_SERVICE: Any = object()
+
+# batches resolved again after their services changed in the meantime, before `resolve_many` blocks changes
+_RESOLVE_MANY_ATTEMPTS = 8
+
+# stands for all keys in generations of changes, for changes like `clear_cache()` not tied to particular keys
+_EVERY_KEY: Any = object()
+
+# equal typing keys created anew, like `list[X]`, get new identities, so routes of a container are bounded
+_ROUTES_MAX_SIZE = 4096
 
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _mutation(method: F) -> F:
+    # mutations of the container and of its tracked dicts are serialized between threads
+    @wraps(method)
+    def _mutate(self, *args, **kwargs):
+        with self._mutation_lock:
+            return method(self, *args, **kwargs)
+
+    return _mutate  # type: ignore
+
+
+class _TrackedDict(dict):
+    """Dict that reports every write, so direct changes to `Container.factories` are not missed."""
+
+    def __init__(self, on_change: Callable[[Tuple[Any, ...], bool], None], mutation_lock: RLock):
+        super().__init__()
+        # called with changed keys, and whether any of them was added or removed rather than replaced
+        self._on_change = on_change
+        self._mutation_lock = mutation_lock
+        self._frozen = False
+
+    def freeze(self) -> None:
+        self._frozen = True
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise FrozenContainerError("Cannot modify services of a frozen container.")
+
+    @_mutation
+    def __setitem__(self, key, value) -> None:
+        self._check_mutable()
+        structural = key not in self
+        super().__setitem__(key, value)
+        self._on_change((key,), structural)
+
+    @_mutation
+    def __delitem__(self, key) -> None:
+        self._check_mutable()
+        super().__delitem__(key)
+        self._on_change((key,), True)
+
+    @_mutation
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        self._check_mutable()
+        result = super().pop(key)
+        self._on_change((key,), True)
+        return result
+
+    @_mutation
+    def popitem(self):
+        self._check_mutable()
+        key, value = super().popitem()
+        self._on_change((key,), True)
+        return key, value
+
+    @_mutation
+    def setdefault(self, key, default=None):
+        self._check_mutable()
+        structural = key not in self
+        result = super().setdefault(key, default)
+        self._on_change((key,), structural)
+        return result
+
+    @_mutation
+    def update(self, *args, **kwargs) -> None:
+        self._check_mutable()
+        changes = dict(*args, **kwargs)
+        structural = any(key not in self for key in changes)
+        super().update(changes)
+        self._on_change(tuple(changes), structural)
+
+    @_mutation
+    def clear(self) -> None:
+        self._check_mutable()
+        keys = tuple(self)
+        super().clear()
+        self._on_change(keys, True)
+
+
+class _ManagedInstance:
+    """Entered context manager of a managed service, with managed services entered while creating it."""
+
+    __slots__ = ("key", "manager", "asynchronous", "entered_within")
+
+    def __init__(self, key: Any, manager: Any, asynchronous: bool, entered_within: List["_ManagedInstance"]):
+        self.key = key
+        self.manager = manager
+        self.asynchronous = asynchronous
+        self.entered_within = entered_within
 
 
 class Container:
     def __init__(self):
+        self._mutation_lock = RLock()
+        self._generation = 0
+        # increased only when keys are registered, removed or change the way they are resolved
+        self._layout = 0
+        self._listeners: List[Callable[["Container"], None]] = []
         self._memoized_services: Dict[Union[str, Type], Any] = {}
+        # keys whose services are memoized by a cache policy instead of `_memoized_services`
+        self._cache_policies: Dict[Union[str, Type], CachePolicy] = {}
         self._services: Dict[Union[str, Type], Any] = {}
-        self._factories: Dict[Union[str, Type], Callable[[Container], Any]] = {}
-        self._aliases: Dict[Union[str, Type], List[Union[str, Type]]] = {}
+        self._factories: Dict[Union[str, Type], Callable[[Container], Any]] = _TrackedDict(
+            self._changed_services, self._mutation_lock
+        )
+        # targets of each alias in the order they were added, kept as dict keys so any of them is removed in O(1)
+        self._aliases: Dict[Union[str, Type], Dict[Union[str, Type], None]] = {}
+        # reverse index of aliases, from each target to all aliases it is registered under
+        self._aliased_by: Dict[Union[str, Type], Set[Union[str, Type]]] = {}
+        # keys under which lists of services registered under each alias were memoized, e.g. `List[alias]`
+        self._alias_list_keys: Dict[Union[str, Type], Set[Any]] = {}
+        self._scoped: Dict[Union[str, Type], Callable[[Container], Any]] = _TrackedDict(
+            self._changed_services, self._mutation_lock
+        )
+        self._scope: ContextVar[Optional[Dict[Union[str, Type], Any]]] = ContextVar(
+            f"kink_scope_{id(self)}", default=None
+        )
+        self._async_services: Dict[Union[str, Type], Callable[[Container], Awaitable[Any]]] = {}
+        self._async_factories: Dict[Union[str, Type], Callable[[Container], Awaitable[Any]]] = {}
+        self._pending: Dict[Union[str, Type], "asyncio.Future[Any]"] = {}
+        self._pools: Dict[Union[str, Type], Pool] = {}
+        # context managers of managed services in the order they were entered, exited by `close()` or `aclose()`
+        self._managed: List[_ManagedInstance] = []
+        self._entering: ContextVar[Optional[List[_ManagedInstance]]] = ContextVar(
+            f"kink_entering_{id(self)}", default=None
+        )
+        self._locks: Dict[Union[str, Type], RLock] = {}
+        self._locks_guard = Lock()
+        self._frozen = False
+        self._frozen_resolve: Optional[Callable[[Any], Any]] = None
+        # services memoized by the lookups of a frozen container, by key
+        self._frozen_resolved: Dict[Any, List[Any]] = {}
+        self._instrumentation: Optional[Instrumentation] = None
+        # typing keys by identity, with the key they are looked up as, dropped whenever keys are registered or removed
+        self._routes: Dict[int, Tuple[Any, Any]] = {}
+        # generation of the last change of each key, telling batch lookups whether their services changed
+        self._key_changes: Dict[Any, int] = {}
+
+    def _changed_services(self, keys: Tuple[Any, ...], structural: bool) -> None:
+        for key in keys:
+            self._forget_alias_lists(key)
+        self._changed(structural, keys)
+
+    def _forget_alias_lists(self, key: Any) -> None:
+        # memoized `List[alias]` services contain the replaced or removed service
+        for alias in self._aliased_by.get(key, ()):
+            self._forget_alias_list(alias)
+
+    def _first_target(self, alias: Any) -> Any:
+        return next(iter(self._aliases[alias]))
+
+    def _forget_alias_list(self, alias: Any) -> None:
+        for key in self._alias_list_keys.pop(alias, ()):
+            self._memoized_services.pop(key, None)
+            self._forget_frozen(key)
 
+    def _changed(self, structural: bool = True, keys: Optional[Iterable[Any]] = None) -> None:
+        # `keys` are the changed keys, all keys when not given
+        if structural:
+            self._layout += 1
+            self._routes = {}
+        self._generation += 1
+        for key in (_EVERY_KEY,) if keys is None else keys:
+            self._key_changes[key] = self._generation
+        for listener in tuple(self._listeners):
+            listener(self)
+
+    @property
+    def generation(self) -> int:
+        """Monotonic number increased on every change of what the container resolves."""
+        return self._generation
+
+    def subscribe(self, listener: Callable[["Container"], None]) -> None:
+        """Register a callable invoked with the container after each change."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[["Container"], None]) -> None:
+        self._listeners.remove(listener)
+
+    @_mutation
     def __setitem__(self, key: Union[str, Type], value: Any) -> None:
+        self._check_mutable()
+        # replacing a plain service, like a per request value, leaves the way the key is resolved as it is
+        structural = (
+            key not in self._services
+            or key in self._scoped
+            or key in self._async_services
+            or key in self._async_factories
+            or key in self._pools
+        )
         self._services[key] = value
+        self._scoped.pop(key, None)
+        self._async_services.pop(key, None)
+        self._async_factories.pop(key, None)
+        self._pools.pop(key, None)
+        self._forget_memoized(key)
+        self._forget_alias_lists(key)
+        self._changed(structural, (key,))
 
-        if key in self._memoized_services:
-            del self._memoized_services[key]
-
+    @_mutation
     def __delitem__(self, key: Union[str, Type]) -> None:
         """Remove a service from the container."""
+        self._check_mutable()
         service_exists = False
 
         # Remove from services
@@ -37,39 +270,208 @@ class Container:
             del self._factories[key]
             service_exists = True
 
+        # Remove from scoped services
+        if key in self._scoped:
+            del self._scoped[key]
+            service_exists = True
+
+        # Remove from async services and factories
+        if key in self._async_services:
+            del self._async_services[key]
+            service_exists = True
+
+        if key in self._async_factories:
+            del self._async_factories[key]
+            service_exists = True
+
+        # Remove from pooled services
+        if key in self._pools:
+            del self._pools[key]
+            service_exists = True
+
         # Remove from memoized services
-        if key in self._memoized_services:
-            del self._memoized_services[key]
+        self._forget_memoized(key)
+        self._cache_policies.pop(key, None)
+        self._locks.pop(key, None)
 
         # Remove from aliases (if key is used as an alias target)
-        aliases_to_remove = []
-        for alias_name, targets in self._aliases.items():
-            if key in targets:
-                targets.remove(key)
-                if not targets:  # Remove empty alias lists
-                    aliases_to_remove.append(alias_name)
+        self._forget_alias_lists(key)
+        for alias_name in self._aliased_by.pop(key, ()):
+            targets = self._aliases[alias_name]
+            targets.pop(key, None)
+            if not targets:  # Remove empty alias lists
+                del self._aliases[alias_name]
 
-        for alias_name in aliases_to_remove:
-            del self._aliases[alias_name]
-
-        # Remove if key is an alias itself
+        # Remove if key is an alias itself, clearing its memoized List[key] service
         if key in self._aliases:
-            del self._aliases[key]
-
-        # Clear any List[key] memoized services
-        if List[key] in self._memoized_services:  # type: ignore
-            del self._memoized_services[List[key]]  # type: ignore
+            for target in self._aliases.pop(key):
+                aliases = self._aliased_by.get(target)
+                if aliases:
+                    aliases.discard(key)
+            self._forget_alias_list(key)
 
         if not service_exists:
             raise KeyError(f"Service {key} is not registered.")
 
+        self._changed()
+
+    @_mutation
     def add_alias(self, name: Union[str, Type], target: Union[str, Type]):
-        if List[target] in self._memoized_services:  # type: ignore
-            del self._memoized_services[List[target]]  # type: ignore
+        self._check_mutable()
+        self._forget_alias_list(name)
 
         if name not in self._aliases:
-            self._aliases[name] = []
-        self._aliases[name].append(target)
+            self._aliases[name] = {}
+        self._aliases[name][target] = None
+        self._aliased_by.setdefault(target, set()).add(name)
+        self._changed()
+
+    @_mutation
+    def add_async(
+        self, key: Union[str, Type], factory: Callable[["Container"], Awaitable[Any]], use_factory: bool = False
+    ) -> None:
+        """Register a coroutine function building the service, it is memoized unless `use_factory` is set.
+
+        Asynchronous services are resolved with `await container.resolve_async(key)`, or injected
+        into `async` functions decorated with `@inject`.
+        """
+        self._check_mutable()
+        self._services.pop(key, None)
+        self._factories.pop(key, None)
+        self._scoped.pop(key, None)
+        self._forget_memoized(key)
+        self._async_services.pop(key, None)
+        self._async_factories.pop(key, None)
+        self._pools.pop(key, None)
+        self._forget_alias_lists(key)
+
+        if use_factory:
+            self._async_factories[key] = factory
+        else:
+            self._async_services[key] = factory
+        self._changed()
+
+    def add_managed(self, key: Union[str, Type], factory: Callable[["Container"], ContextManager[Any]]) -> None:
+        """Register a memoized service created by entering the context manager returned by the factory.
+
+        The context manager is exited by `container.close()`, after services depending on the service were closed.
+        """
+        self[key] = lambda di: di._enter_managed(key, factory)
+
+    def add_managed_async(
+        self, key: Union[str, Type], factory: Callable[["Container"], AsyncContextManager[Any]]
+    ) -> None:
+        """Register an asynchronous service created by entering the asynchronous context manager returned by the factory.
+
+        The context manager is exited by `await container.aclose()`.
+        """
+        self.add_async(key, lambda di: di._enter_managed_async(key, factory))
+
+    def _enter_managed(self, key: Any, factory: Callable[["Container"], ContextManager[Any]]) -> Any:
+        entered_within: List[_ManagedInstance] = []
+        token = self._entering.set(entered_within)
+        try:
+            manager = factory(self)
+            service = manager.__enter__()
+        finally:
+            self._entering.reset(token)
+
+        self._track_managed(key, manager, False, entered_within)
+        return service
+
+    async def _enter_managed_async(self, key: Any, factory: Callable[["Container"], AsyncContextManager[Any]]) -> Any:
+        entered_within: List[_ManagedInstance] = []
+        token = self._entering.set(entered_within)
+        try:
+            manager = factory(self)
+            service = await manager.__aenter__()
+        finally:
+            self._entering.reset(token)
+
+        self._track_managed(key, manager, True, entered_within)
+        return service
+
+    def _track_managed(
+        self, key: Any, manager: Any, asynchronous: bool, entered_within: List[_ManagedInstance]
+    ) -> None:
+        # services created while the factory ran are its dependencies, even if not known from `@inject`
+        instance = _ManagedInstance(key, manager, asynchronous, entered_within)
+        self._managed.append(instance)
+
+        entering = self._entering.get()
+        if entering is not None:
+            entering.append(instance)
+
+    def close(self) -> None:
+        """Exit context managers of managed services, each one after the services depending on it.
+
+        Closed services and memoized services depending on them are forgotten, so they are created again when
+        requested.
+        """
+        from kink.lifecycle import close
+
+        close(self)
+
+    async def aclose(self) -> None:
+        """Exit context managers of managed services, asynchronous ones included.
+
+        Each service is closed after the services depending on it, independent services are closed concurrently.
+        """
+        from kink.lifecycle import aclose
+
+        await aclose(self)
+
+    @_mutation
+    def add_pooled(
+        self,
+        key: Union[str, Type],
+        factory: Callable[["Container"], Any],
+        max_size: int,
+        timeout: Optional[float] = None,
+    ) -> Pool:
+        """Register a service kept in a pool of at most `max_size` instances, for services which cannot be shared.
+
+        Functions decorated with `@inject` check an instance out of the pool for the duration of each call.
+        Elsewhere instances are used with `container.pool(key).checkout()`.
+        """
+        self._check_mutable()
+        self._services.pop(key, None)
+        self._factories.pop(key, None)
+        self._scoped.pop(key, None)
+        self._forget_memoized(key)
+        self._async_services.pop(key, None)
+        self._async_factories.pop(key, None)
+        self._forget_alias_lists(key)
+
+        pool = self._pools[key] = Pool(partial(_construct, self, key, factory), max_size, timeout)
+        self._changed()
+        return pool
+
+    def pool(self, key: Any) -> Pool:
+        """Pool of the pooled service registered under the key."""
+        pool = self._pool_for(key)
+        if pool is None:
+            raise ServiceError(f"Service {key} is not pooled.")
+        return pool
+
+    def _pool_for(self, key: Any) -> Optional[Pool]:
+        if type(key) is not str and type(key) is not type:
+            route = self._route(key)
+            if route is not key:
+                return self._pool_for(route)
+
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        if key in self._aliases:
+            return self._pool_for(self._first_target(key))
+
+        canonical, kind = normalize_key(key)
+        if kind is not KEY_PLAIN and kind is not KEY_SEQUENCE:
+            return self._pool_for(canonical)
+
+        return None
 
     @overload
     def __getitem__(self, key: str) -> Any: ...
@@ -78,75 +480,688 @@ class Container:
     def __getitem__(self, key: Type[T]) -> T: ...
 
     def __getitem__(self, key):
-        if key in self._factories:
-            return self._factories[key](self)
+        service = self._resolve(key)
+
+        if service is _MISSING_SERVICE:
+            raise ServiceError(f"Service {key} is not registered.")
+
+        return service
+
+    @overload
+    def get(self, key: str, default: Any = None) -> Any: ...
+
+    @overload
+    def get(self, key: Type[T], default: Any = None) -> Union[T, Any]: ...
+
+    def get(self, key, default=None):
+        """Return the service registered under the key or the default, looking the key up only once."""
+        service = self._resolve(key)
 
-        if is_optional(key):
-            return self[unpack_optional(key)]
+        if service is _MISSING_SERVICE:
+            return default
+
+        return service
+
+    def resolve_many(self, keys: Iterable[Any], report_all_missing: bool = False) -> Tuple[Any, ...]:
+        """Resolve services of all the keys, in their order, against a single state of the container.
+
+        A batch whose services were changed by another thread in the meantime is resolved again, so changes don't
+        wait for it. Only if its services keep changing, the last attempt holds changes off until it is resolved.
+        A missing service raises `ServiceError`, or with `report_all_missing` set, `MissingServicesError` listing all
+        missing keys.
+        """
+        keys = tuple(keys)
+        watched = self._watched_keys(keys)
+        layers = _layers(self)
+        for _ in range(_RESOLVE_MANY_ATTEMPTS):
+            layout, generations = self._layout, [layer._generation for layer in layers]
+            services, missing = self._resolve_batch(keys, report_all_missing)
+            if layout == self._layout and not any(
+                layer._changed_since(generation, watched) for layer, generation in zip(layers, generations)
+            ):
+                break
+        else:
+            # layers are locked from the child to the root
+            with ExitStack() as stack:
+                for layer in layers:
+                    stack.enter_context(layer._mutation_lock)
+                services, missing = self._resolve_batch(keys, report_all_missing)
+
+        if missing:
+            if not report_all_missing:
+                raise ServiceError(f"Service {missing[0]} is not registered.")
+            raise MissingServicesError(missing)
+
+        return tuple(services)
+
+    def _watched_keys(self, keys: Tuple[Any, ...]) -> Set[Any]:
+        # keys whose changes affect the services of a batch, the keys, what they stand for and targets of aliases
+        layers = _layers(self)
+        watched: Set[Any] = set()
+        pending = list(keys)
+        while pending:
+            key = pending.pop()
+            if key in watched:
+                continue
+            watched.add(key)
+            canonical = normalize_key(key)[0]
+            pending.append(canonical)
+            for layer in layers:
+                pending.extend(layer._aliases.get(canonical, ()))
+
+        return watched
+
+    def _changed_since(self, generation: int, keys: Set[Any]) -> bool:
+        if self._generation == generation:
+            return False
+        changes = self._key_changes
+        return changes.get(_EVERY_KEY, 0) > generation or any(changes.get(key, 0) > generation for key in keys)
+
+    def _resolve_batch(self, keys: Tuple[Any, ...], report_all_missing: bool) -> Tuple[List[Any], List[Any]]:
+        services = []
+        missing = []
+        resolve = self._resolve
+        for key in keys:
+            service = resolve(key)
+            if service is _MISSING_SERVICE:
+                missing.append(key)
+                if not report_all_missing:
+                    break
+            services.append(service)
+
+        return services, missing
+
+    def _route(self, key: Any) -> Any:
+        # typing keys hash slowly, so `Optional[X]` and `Annotated[X, ...]` go to `X` without probing every map
+        route = self._routes.get(id(key))
+        if route is not None and route[0] is key:
+            return route[1]
+
+        canonical, kind = normalize_key(key)
+        target = key if kind is KEY_PLAIN or kind is KEY_SEQUENCE or self._is_key_or_alias(key) else canonical
+        if len(self._routes) >= _ROUTES_MAX_SIZE:
+            self._routes = {}
+        self._routes[id(key)] = (key, target)
+        return target
+
+    def _resolve(self, key: Any) -> Any:
+        if type(key) is not str and type(key) is not type:
+            route = self._route(key)
+            if route is not key:
+                return self._resolve(route)
+
+        factory = self._factories.get(key, _MISSING_SERVICE)
+        if factory is not _MISSING_SERVICE:
+            return self._construct(key, factory)
 
         service = self._get(key)
 
         if service is not _MISSING_SERVICE:
             return service
 
+        factory = self._scoped.get(key, _MISSING_SERVICE)
+        if factory is not _MISSING_SERVICE:
+            return self._get_scoped(key, factory)
+
         if key in self._aliases:
-            unaliased_key = self._aliases[key][0]  # By default return first aliased service
-            if unaliased_key in self._factories:
-                return self._factories[unaliased_key](self)
-            service = self._get(unaliased_key)
+            unaliased_key = self._first_target(key)  # By default return first aliased service
+            service = self._resolve(unaliased_key)
+
+            if service is not _MISSING_SERVICE:
+                return service
+
+        canonical, kind = normalize_key(key)
+        if kind is KEY_SEQUENCE:
+            # Support aliasing
+            if canonical in self._aliases:
+                targets = self._aliases[canonical]
+                # targets of parent layers might have been removed since the alias was added
+                services = [self._resolve(alias) for alias in targets]
+                result = [service for service in services if service is not _MISSING_SERVICE]
+                # lists holding factory or scoped services are created again on every lookup, as well as lists
+                # holding services of parent layers, which don't tell their children which of their keys changed
+                if all(self._is_singleton(target, local=True) for target in targets):
+                    self._memoized_services[key] = result
+                    self._alias_list_keys.setdefault(canonical, set()).add(key)
+                return result
+        elif kind is not KEY_PLAIN:
+            return self._resolve(canonical)
+
+        if self._async_key(key) is not _MISSING_SERVICE:
+            raise ResolverError(f"Service {key} is asynchronous, use `await container.resolve_async(key)` instead.")
+
+        if key in self._pools:
+            raise ResolverError(f"Service {key} is pooled, use `container.pool(key).checkout()` instead.")
+
+        return _MISSING_SERVICE
+
+    def is_async(self, key: Any) -> bool:
+        """Tell whether resolving the key requires awaiting an asynchronous factory."""
+        return self._async_key(key) is not _MISSING_SERVICE
+
+    def _async_key(self, key: Any) -> Any:
+        if type(key) is not str and type(key) is not type:
+            route = self._route(key)
+            if route is not key:
+                return self._async_key(route)
+
+        if key in self._async_services or key in self._async_factories:
+            return key
+
+        if key in self._aliases:
+            return self._async_key(self._first_target(key))
+
+        canonical, kind = normalize_key(key)
+        if kind is not KEY_PLAIN and kind is not KEY_SEQUENCE:
+            return self._async_key(canonical)
 
+        return _MISSING_SERVICE
+
+    async def resolve_async(self, key: Any) -> Any:
+        """Resolve a service which might be built by an asynchronous factory."""
+        async_key = self._async_key(key)
+        if async_key is _MISSING_SERVICE:
+            return self[key]
+
+        if async_key != key:
+            return await self.resolve_async(async_key)
+
+        factory = self._async_factories.get(async_key, _MISSING_SERVICE)
+        if factory is not _MISSING_SERVICE:
+            return await self._construct_async(async_key, factory)
+
+        service = self._memoized_services.get(async_key, _MISSING_SERVICE)
         if service is not _MISSING_SERVICE:
             return service
 
-        # Support aliasing
-        if self._has_alias_list_for(key):
-            result = [self._get(alias) for alias in self._aliases[key.__args__[0]]]  # type: ignore
-            self._memoized_services[key] = result
-            return result
+        # concurrent resolvers of a cold key share a single construction
+        pending = self._pending.get(async_key)
+        if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+            pending = asyncio.ensure_future(self._memoize_async(async_key, self._async_services[async_key]))
+            self._pending[async_key] = pending
+            pending.add_done_callback(lambda done: self._forget_pending(async_key, done))
+
+        # waiters being cancelled must not cancel the construction shared with others
+        return await asyncio.shield(pending)
+
+    async def _memoize_async(self, key: Any, factory: Callable[["Container"], Awaitable[Any]]) -> Any:
+        service = await self._construct_async(key, factory)
+        if self._async_services.get(key, _MISSING_SERVICE) is factory:
+            self._memoized_services[key] = service
+
+        return service
 
-        raise ServiceError(f"Service {key} is not registered.")
+    async def _construct_async(self, key: Any, factory: Callable[["Container"], Awaitable[Any]]) -> Any:
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return await factory(self)
+
+        start = perf_counter()
+        try:
+            return await factory(self)
+        finally:
+            instrumentation.after_construct(key, perf_counter() - start)
+
+    def _forget_pending(self, key: Any, pending: "asyncio.Future[Any]") -> None:
+        if self._pending.get(key) is pending:
+            del self._pending[key]
 
     def _get(self, key: Union[str, Type]) -> Any:
-        if key in self._memoized_services:
-            return self._memoized_services[key]
+        service = self._memoized_services.get(key, _MISSING_SERVICE)
+        if service is not _MISSING_SERVICE:
+            return service
 
-        if key not in self._services:
+        value = self._services.get(key, _MISSING_SERVICE)
+        if value is _MISSING_SERVICE:
             return _MISSING_SERVICE
 
-        value = self._services[key]
-
-        if isinstance(value, LambdaType) and value.__name__ == "<lambda>":
-            self._memoized_services[key] = value(self)
-            return self._memoized_services[key]
+        if _is_lambda(value):
+            return self._memoize(key, value)
 
         return value
 
-    def __contains__(self, key) -> bool:
-        contains = key in self._services or key in self._factories or key in self._aliases
+    def _memoize(self, key: Union[str, Type], factory: Callable[["Container"], Any]) -> Any:
+        cache: Any = self._cache_policies.get(key)
+        if cache is None:
+            cache = self._memoized_services
+        else:
+            service = cache.get(key, _MISSING_SERVICE)
+            if service is not _MISSING_SERVICE:
+                return service
+
+        # memoized reads never lock, only threads racing for a cold key wait for its single construction
+        with self._lock_for(key):
+            service = cache.get(key, _MISSING_SERVICE)
+            if service is not _MISSING_SERVICE:
+                return service
 
-        if contains:
-            return contains
+            service = self._construct(key, factory)
+            # don't cache a service which was replaced or removed while it was being constructed
+            if self._services.get(key, _MISSING_SERVICE) is factory:
+                cache[key] = service
 
-        if self._has_alias_list_for(key):
+            return service
+
+    def _is_singleton(self, key: Any, local: bool = False) -> bool:
+        """Tell whether every lookup of the key returns the same service, with `local` one owned by this layer."""
+        owner = self._owner(key)
+        if owner is not self:
+            return not local and owner is not None and owner._is_singleton(key)
+
+        # services of cache policies might be evicted and created again
+        if key in self._factories or key in self._scoped or key in self._cache_policies:
+            return False
+        if key in self._services:
             return True
+        if key in self._aliases:
+            return self._is_singleton(self._first_target(key), local)
+
+        return False
+
+    def _forget_memoized(self, key: Union[str, Type]) -> None:
+        self._memoized_services.pop(key, None)
+        self._forget_frozen(key)
+        policy = self._cache_policies.get(key)
+        if policy is not None:
+            policy.pop(key, None)
+
+    def _forget_frozen(self, key: Any) -> None:
+        resolved = self._frozen_resolved.get(key)
+        if resolved is not None:
+            resolved[0] = _MISSING_SERVICE
+
+    def _is_memoized(self, key: Union[str, Type]) -> bool:
+        policy = self._cache_policies.get(key)
+        if policy is not None:
+            return policy.get(key, _MISSING_SERVICE) is not _MISSING_SERVICE
+        return key in self._memoized_services
+
+    def _get_scoped(self, key: Union[str, Type], factory: Callable[["Container"], Any]) -> Any:
+        services = self._scope.get()
+        if services is None:
+            raise ResolverError(f"Service {key} is scoped and cannot be resolved outside of `container.scope()`.")
+
+        service = services.get(key, _MISSING_SERVICE)
+        if service is _MISSING_SERVICE:
+            service = services[key] = self._construct(key, factory)
+
+        return service
 
-        if is_optional(key):
-            return unpack_optional(key) in self
+    @contextmanager
+    def scope(self) -> Iterator[Dict[Union[str, Type], Any]]:
+        """Open a scope in which every scoped service is created once.
+
+        The scope is bound to the current context, so it is shared by asyncio tasks started
+        inside of it, and its services are dropped when it ends.
+        """
+        services: Dict[Union[str, Type], Any] = {}
+        token = self._scope.set(services)
+        try:
+            yield services
+        finally:
+            self._scope.reset(token)
+
+    def _construct(self, key: Union[str, Type], factory: Callable[["Container"], Any]) -> Any:
+        return factory(self)
+
+    def _lock_for(self, key: Union[str, Type]) -> RLock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(key, RLock())
+        return lock
+
+    def __contains__(self, key) -> bool:
+        if type(key) is not str and type(key) is not type:
+            route = self._route(key)
+            if route is not key:
+                return route in self
+
+        if self._is_key_or_alias(key):
+            return True
+
+        canonical, kind = normalize_key(key)
+        if kind is KEY_SEQUENCE:
+            return canonical in self._aliases
+        if kind is not KEY_PLAIN:
+            return canonical in self
 
         return False
 
+    def _is_key_or_alias(self, key: Any) -> bool:
+        return self._registers(key) or key in self._aliases
+
     def _has_alias_list_for(self, key: Union[str, Type]) -> bool:
-        return hasattr(key, "__origin__") and hasattr(key, "__args__") and key.__origin__ == list and key.__args__[0] in self._aliases  # type: ignore
+        canonical, kind = normalize_key(key)
+        return kind is KEY_SEQUENCE and canonical in self._aliases
 
     @property
     def factories(self) -> Dict[Union[str, Type], Callable[["Container"], Any]]:
         return self._factories
 
+    @property
+    def scoped(self) -> Dict[Union[str, Type], Callable[["Container"], Any]]:
+        return self._scoped
+
+    @_mutation
+    def set_cache_policy(self, key: Union[str, Type], policy: Optional[CachePolicy]) -> None:
+        """Memoize the service registered under the key with the cache policy, `None` restores plain memoization.
+
+        Only services registered as lambdas are memoized, so only these are affected by cache policies.
+        """
+        self._check_mutable()
+        self._forget_memoized(key)
+        self._forget_alias_lists(key)
+        if policy is None:
+            self._cache_policies.pop(key, None)
+        else:
+            self._cache_policies[key] = policy
+        self._changed(structural=False, keys=(key,))
+
+    @_mutation
     def clear_cache(self) -> None:
+        self._check_mutable()
         self._memoized_services = {}
+        self._alias_list_keys = {}
+        for policy in set(self._cache_policies.values()):
+            policy.clear()
+        self._changed(structural=False)
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise FrozenContainerError("Cannot modify a frozen container.")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @_mutation
+    def freeze(self) -> "Container":
+        """Make the container immutable and optimise it for lookups.
+
+        Every registered key, `Optional[key]` and `List[alias]` is mapped to a function resolving it,
+        so a lookup is a single dict hit and a call. The container is frozen in place and returned,
+        services already injected from it use the optimised lookups as well.
+        """
+        if self._frozen:
+            return self
+
+        self._frozen = True
+        self._factories.freeze()  # type: ignore
+        self._scoped.freeze()  # type: ignore
+
+        resolve = partial(type(self)._resolve, self)
+        table: Dict[Any, Callable[[], Any]] = {}
+        # follows the precedence of lookups: factories, services, scoped and asynchronous services
+        for key, factory in self._factories.items():
+            table[key] = partial(_construct, self, key, factory)
+        for key, value in self._services.items():
+            if _is_lambda(value) and key in self._cache_policies:
+                table.setdefault(key, partial(resolve, key))
+            elif _is_lambda(value):
+                table.setdefault(key, self._resolve_once(resolve, key))
+            else:
+                table.setdefault(key, partial(_identity, value))
+        for key, factory in self._scoped.items():
+            table.setdefault(key, partial(self._get_scoped, key, factory))
+        for key in (*self._async_services, *self._async_factories):
+            table.setdefault(key, partial(resolve, key))
+        for alias, targets in self._aliases.items():
+            if alias not in table:
+                table[alias] = table.get(next(iter(targets))) or partial(resolve, alias)
+            try:
+                list_key = List[alias]  # type: ignore
+            except SyntaxError:  # string alias which is not a valid forward reference
+                continue
+            if all(self._is_singleton(target) for target in targets):
+                table[list_key] = self._resolve_once(resolve, list_key)
+            else:
+                table[list_key] = partial(resolve, list_key)
+        for key in tuple(table):
+            if not isinstance(key, str):
+                try:
+                    table.setdefault(Optional[key], table[key])  # type: ignore
+                except TypeError:  # not a type
+                    pass
+
+        def _resolve_frozen(key: Any) -> Any:
+            resolver = table.get(key)
+            if resolver is None:
+                return resolve(key)
+            return resolver()
+
+        self._frozen_resolve = _resolve_frozen
+        self._install_resolve()
+
+        return self
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self._instrumentation
+
+    def instrument(self, instrumentation: Optional[Instrumentation]) -> None:
+        """Report lookups and constructions of services to the instrumentation, `None` turns reporting off."""
+        self._instrumentation = instrumentation
+        self._install_resolve()
+
+        if instrumentation is None:
+            self.__dict__.pop("_construct", None)
+        else:
+            self._construct = instrument_construct(instrumentation, self)  # type: ignore
+
+    def _resolve_once(self, resolve: Callable[[Any], Any], key: Any) -> Callable[[], Any]:
+        # the single slot holding the service is emptied when the memoized service is forgotten
+        resolved = self._frozen_resolved[key] = [_MISSING_SERVICE]
+        return _resolve_once(resolve, key, resolved)
+
+    def _install_resolve(self) -> None:
+        # frozen and instrumented lookups shadow the method, so plain containers are not slowed down by any checks
+        resolve = self._frozen_resolve
+        if self._instrumentation is not None:
+            resolve = instrument_resolve(
+                resolve or partial(type(self)._resolve, self), self._instrumentation, _MISSING_SERVICE
+            )
+
+        if resolve is None:
+            self.__dict__.pop("_resolve", None)
+        else:
+            self._resolve = resolve  # type: ignore
+
+    def warm_up(self, keys: Optional[Iterable[Any]] = None, max_workers: int = 1) -> Dict[Any, float]:
+        """Create memoized services ahead of time, every service after the services it depends on.
+
+        Either all services are created, or the given keys (or services aliased by them) and their dependencies.
+        With `max_workers` above one, services which don't depend on each other are created concurrently
+        on a thread pool. Returns seconds it took to create each service, in the order the services were created.
+        """
+        from kink.warm_up import warm_up
+
+        return warm_up(self, keys, max_workers)
+
+    def invalidate(self, *keys: Any, where: Optional[Callable[[Any], bool]] = None, cascade: bool = False) -> List[Any]:
+        """Drop memoized services of the keys, leaving the rest of the cache warm.
+
+        An alias invalidates all services registered under it, and `where` selects registered keys to
+        invalidate by a predicate. With `cascade` set, memoized services depending on invalidated ones, as
+        known from `@inject`, are invalidated as well. Frozen containers can be invalidated too, as registrations
+        stay the same. Returns keys of the services which were dropped.
+        """
+        from kink.invalidation import invalidate
+
+        return invalidate(self, keys, where, cascade)
+
+    def validate(self, strict: bool = True) -> "DependencyGraph":
+        """Build the dependency graph of services decorated with `@inject` and check it for problems.
+
+        Raises `ResolverError` listing every dependency cycle and every constructor parameter which
+        cannot be resolved, unless `strict` is turned off. Unresolved parameters of injected functions are
+        reported in the graph only, as functions are usually called with some arguments.
+        """
+        from kink.graph import DependencyGraph
+
+        graph = DependencyGraph.build(self)
+        if strict and graph.problems():
+            raise ResolverError("Invalid container:\n" + "\n".join(graph.problems()))
+
+        return graph
+
+    def _local_keys(self) -> List[Any]:
+        return [
+            *self._factories,
+            *self._services,
+            *self._scoped,
+            *self._async_services,
+            *self._async_factories,
+            *self._pools,
+        ]
+
+    def _registers(self, key: Any) -> bool:
+        return (
+            key in self._factories
+            or key in self._services
+            or key in self._scoped
+            or key in self._async_services
+            or key in self._async_factories
+            or key in self._pools
+        )
+
+    def child(self) -> "ChildContainer":
+        """Create a container overriding services of this one without copying them."""
+        return ChildContainer(self)
+
+    def _owner(self, key: Any) -> Optional["Container"]:
+        return self if key in self else None
+
+
+class ChildContainer(Container):
+    """Container layered on top of a parent container.
+
+    Services are looked up in the child first and then in its parent. Services are created
+    and memoized by the layer they are registered in.
+    """
+
+    def __init__(self, parent: Container):
+        super().__init__()
+        self._parent = parent
+        # layer owning each key looked up so far, dropped whenever keys of this or any parent layer change
+        self._view: Dict[Any, Optional[Container]] = {}
+
+        forward = _forward_changes(self)
+        parent.subscribe(forward)
+        weakref.finalize(self, _unsubscribe, parent, forward)
+
+    @property
+    def parent(self) -> Container:
+        return self._parent
+
+    def _changed(self, structural: bool = True, keys: Optional[Iterable[Any]] = None) -> None:
+        if structural:
+            self._view = {}
+        super()._changed(structural, keys)
+
+    def _owner(self, key: Any) -> Optional[Container]:
+        owner = self._view.get(key, _MISSING_SERVICE)
+        if owner is _MISSING_SERVICE:
+            owner = self if Container.__contains__(self, key) else self._parent._owner(key)
+            self._view[key] = owner
+        return owner
+
+    def _resolve(self, key: Any) -> Any:
+        owner = self._owner(key)
+        if owner is self:
+            return super()._resolve(key)
+        if owner is None:
+            return _MISSING_SERVICE
+        return owner._resolve(key)
+
+    def __contains__(self, key) -> bool:
+        return self._owner(key) is not None
+
+    def _async_key(self, key: Any) -> Any:
+        owner = self._owner(key)
+        if owner is self:
+            return super()._async_key(key)
+        if owner is None:
+            return _MISSING_SERVICE
+        return owner._async_key(key)
+
+    def _pool_for(self, key: Any) -> Optional[Pool]:
+        owner = self._owner(key)
+        if owner is self:
+            return super()._pool_for(key)
+        if owner is None:
+            return None
+        return owner._pool_for(key)
+
+    async def resolve_async(self, key: Any) -> Any:
+        owner = self._owner(key)
+        if owner is not None and owner is not self:
+            return await owner.resolve_async(key)
+        return await super().resolve_async(key)
+
+    @contextmanager
+    def scope(self) -> Iterator[Dict[Union[str, Type], Any]]:
+        # scoped services of parent layers are created within their own layer's scope
+        with self._parent.scope(), super().scope() as services:
+            yield services
+
+
+def _layers(container: Container) -> List[Container]:
+    layers = []
+    layer: Optional[Container] = container
+    while layer is not None:
+        layers.append(layer)
+        layer = getattr(layer, "_parent", None)
+    return layers
+
+
+def _is_lambda(value: Any) -> bool:
+    # services registered as lambdas are created on demand and memoized
+    return isinstance(value, LambdaType) and value.__name__ == "<lambda>"
+
+
+def _construct(container: Container, key: Any, factory: Callable[[Container], Any]) -> Any:
+    return container._construct(key, factory)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _resolve_once(resolve: Callable[[Any], Any], key: Any, resolved: List[Any]) -> Callable[[], Any]:
+    def _resolver() -> Any:
+        service = resolved[0]
+        if service is _MISSING_SERVICE:
+            service = resolve(key)
+            if service is not _MISSING_SERVICE:
+                resolved[0] = service
+        return service
+
+    return _resolver
+
+
+def _forward_changes(child: ChildContainer) -> Callable[[Container], None]:
+    # the parent must not keep its children alive
+    child_ref = weakref.ref(child)
+    parent_layout = child._parent._layout
+
+    def _forward(parent: Container) -> None:
+        nonlocal parent_layout
+        child = child_ref()
+        if child is not None:
+            structural, parent_layout = parent._layout != parent_layout, parent._layout
+            # batch lookups of the child check changed keys of the parent on their own
+            child._changed(structural, ())
+
+    return _forward
+
+
+def _unsubscribe(parent: Container, listener: Callable[[Container], None]) -> None:
+    if listener in parent._listeners:
+        parent.unsubscribe(listener)
 
 
 di: Container = Container()
 
 
-__all__ = ["Container", "di"]
+__all__ = ["ChildContainer", "Container", "di"]
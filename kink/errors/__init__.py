@@ -1,4 +1,7 @@
 from .conainer_error import ContainerError
 from .execution_error import ExecutionError
+from .frozen_container_error import FrozenContainerError
+from .missing_services_error import MissingServicesError
+from .pool_timeout_error import PoolTimeoutError
 from .resolver_error import ResolverError
 from .service_error import ServiceError
@@ -0,0 +1,9 @@
+from typing import Any, List
+
+from .service_error import ServiceError
+
+
+class MissingServicesError(ServiceError):
+    def __init__(self, keys: List[Any]):
+        super().__init__(f"Services {', '.join(str(key) for key in keys)} are not registered.")
+        self.keys = keys
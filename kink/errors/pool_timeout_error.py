@@ -0,0 +1,5 @@
+from .conainer_error import ContainerError
+
+
+class PoolTimeoutError(ContainerError):
+    pass
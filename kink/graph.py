@@ -0,0 +1,185 @@
+from inspect import isclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from kink.container import Container, _is_lambda, _layers
+from kink.errors.resolver_error import ResolverError
+from kink.inject import Injection
+from kink.typing_support import KEY_PLAIN, KEY_SEQUENCE, key_name, normalize_key
+
+_END = object()
+
+
+def _injection_of(layer: Container, key: Any) -> Tuple[Optional[Injection], bool]:
+    """Injection describing dependencies of the registered service and whether the container constructs it."""
+    value = layer._services.get(key)
+    constructed = key not in layer._services or _is_lambda(value)
+
+    if isclass(key) and constructed:
+        return getattr(key.__init__, "__injection__", None), True
+
+    return getattr(value, "__injection__", None), False
+
+
+def _targets(container: Container, key: Any) -> List[Any]:
+    """Registered services which are used when the key is resolved."""
+    for layer in _layers(container):
+        if layer._registers(key):
+            return [key]
+
+        if key in layer._aliases:
+            return _targets(layer, layer._first_target(key))
+
+        if layer._has_alias_list_for(key):
+            return [target for alias in layer._aliases[normalize_key(key)[0]] for target in _targets(layer, alias)]
+
+    canonical, kind = normalize_key(key)
+    if kind is not KEY_PLAIN and kind is not KEY_SEQUENCE:
+        return _targets(container, canonical)
+
+    return []
+
+
+class DependencyGraph:
+    """Services of a container and the services their `@inject` decorated constructors and functions depend on."""
+
+    def __init__(self) -> None:
+        self.edges: Dict[Any, List[Any]] = {}
+        self.unresolved: Dict[Any, Tuple[str, ...]] = {}
+        # parameters of constructors which would receive pooled instances
+        self.pooled: Dict[Any, Tuple[str, ...]] = {}
+        self.constructed: Dict[Any, bool] = {}
+        self.cycles: List[List[Any]] = []
+
+    @classmethod
+    def build(cls, container: Container) -> "DependencyGraph":
+        graph = cls()
+        for layer in _layers(container):
+            for key in layer._local_keys():
+                if key in graph.edges:  # overridden by a child container
+                    continue
+
+                injection, constructed = _injection_of(layer, key)
+                graph.constructed[key] = constructed
+                graph.edges[key] = []
+                if injection is None:
+                    continue
+
+                for dependency in injection.dependencies().values():
+                    graph.edges[key].extend(_targets(container, dependency))
+                unresolved = injection.unresolved()
+                if unresolved:
+                    graph.unresolved[key] = unresolved
+                pooled = injection.pooled()
+                if pooled and injection.service.__name__ == "__init__":
+                    graph.pooled[key] = pooled
+
+        graph.cycles = graph._find_cycles()
+        return graph
+
+    @property
+    def nodes(self) -> List[Any]:
+        return list(self.edges)
+
+    def dependencies(self, key: Any) -> List[Any]:
+        return self.edges.get(key, [])
+
+    def dependents(self, keys: Iterable[Any]) -> List[Any]:
+        """Keys of services depending on any of the keys, directly or through other services."""
+        reverse: Dict[Any, List[Any]] = {}
+        for key, dependencies in self.edges.items():
+            for dependency in dependencies:
+                reverse.setdefault(dependency, []).append(key)
+
+        dependents = []
+        seen = set(keys)
+        stack = list(seen)
+        while stack:
+            for dependent in reverse.get(stack.pop(), []):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    dependents.append(dependent)
+                    stack.append(dependent)
+        return dependents
+
+    def problems(self) -> List[str]:
+        problems = [
+            f"Cannot resolve parameters `{'`, `'.join(parameters)}` of service `{key_name(key)}`."
+            for key, parameters in self.unresolved.items()
+            if self.constructed.get(key)
+        ]
+        problems += [
+            f"Cannot inject pooled services into parameters `{'`, `'.join(parameters)}` of service `{key_name(key)}`."
+            for key, parameters in self.pooled.items()
+        ]
+        problems += [f"Circular dependency: {' -> '.join(key_name(key) for key in cycle)}." for cycle in self.cycles]
+        return problems
+
+    def _find_cycles(self) -> List[List[Any]]:
+        cycles = []
+        visited = set()
+        for root in self.edges:
+            if root in visited:
+                continue
+            path: List[Any] = [root]
+            on_path = {root}
+            iterators = [iter(self.edges[root])]
+            visited.add(root)
+            while iterators:
+                dependency = next(iterators[-1], _END)
+                if dependency is _END:
+                    iterators.pop()
+                    on_path.discard(path.pop())
+                    continue
+                if dependency in on_path:
+                    cycles.append(path[path.index(dependency) :] + [dependency])
+                    continue
+                if dependency in visited or dependency not in self.edges:
+                    continue
+                visited.add(dependency)
+                path.append(dependency)
+                on_path.add(dependency)
+                iterators.append(iter(self.edges[dependency]))
+        return cycles
+
+    def topological_order(self, keys: Optional[Iterable[Any]] = None) -> List[Any]:
+        """Keys, with all their dependencies, ordered so that every service comes after its dependencies."""
+        if self.cycles:
+            raise ResolverError(self.problems()[-1])
+
+        order: List[Any] = []
+        done = set()
+        for root in self.edges if keys is None else keys:
+            stack = [(root, iter(self.edges.get(root, [])))]
+            if root in done:
+                continue
+            done.add(root)
+            while stack:
+                key, dependencies = stack[-1]
+                dependency = next(dependencies, _END)
+                if dependency is _END:
+                    stack.pop()
+                    order.append(key)
+                elif dependency not in done:
+                    done.add(dependency)
+                    stack.append((dependency, iter(self.edges.get(dependency, []))))
+        return order
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": [key_name(key) for key in self.edges],
+            "edges": [[key_name(key), key_name(dependency)] for key, deps in self.edges.items() for dependency in deps],
+            "unresolved": {key_name(key): list(parameters) for key, parameters in self.unresolved.items()},
+            "pooled": {key_name(key): list(parameters) for key, parameters in self.pooled.items()},
+            "cycles": [[key_name(key) for key in cycle] for cycle in self.cycles],
+        }
+
+    def to_dot(self) -> str:
+        lines = ["digraph kink {"]
+        for key, dependencies in self.edges.items():
+            lines.append(f'  "{key_name(key)}";')
+            lines += [f'  "{key_name(key)}" -> "{key_name(dependency)}";' for dependency in dependencies]
+        lines.append("}")
+        return "\n".join(lines)
+
+
+__all__ = ["DependencyGraph"]
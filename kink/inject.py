@@ -4,12 +4,14 @@ import sys
 from abc import ABC
 from functools import wraps
 from inspect import Parameter as InspectParameter, isclass, signature
-from typing import Any, Callable, Dict, NewType, Tuple, Type, TypeVar, Union, ForwardRef, Optional  # type: ignore
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NewType, Tuple, Type, TypeVar, Union, ForwardRef, Optional  # type: ignore
 
 from typing_extensions import Protocol
 
-from .container import di, Container
-from .errors import ExecutionError
+from .container import _MISSING_SERVICE, di, Container
+from .errors import ExecutionError, ResolverError
+from .lazy import LazyProxy, is_lazy, unpack_lazy
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -44,11 +46,15 @@ class Parameter:
     type: Any
     name: str
     default: Any
+    kind: Any
 
-    def __init__(self, name: str, type: Any = Any, default: Any = Undefined):
+    def __init__(
+        self, name: str, type: Any = Any, default: Any = Undefined, kind: Any = InspectParameter.POSITIONAL_OR_KEYWORD
+    ):
         self.name = name
         self.type = type
         self.default = default
+        self.kind = kind
 
 
 def _inspect_function_arguments(
@@ -71,38 +77,214 @@ def _inspect_function_arguments(
             parameter.name,
             annotation,
             parameter.default if parameter.default is not InspectParameter.empty else Undefined,
+            parameter.kind,
         )
 
     return parameters_name, parameters
 
 
-def _resolve_function_kwargs(
+# Sources a parameter can be resolved from, in order of precedence.
+_FROM_ALIAS = "alias"
+_FROM_NAME = "name"
+_FROM_TYPE = "type"
+_FROM_DEFAULT = "default"
+_UNRESOLVED = "unresolved"
+# parameter annotated with `Lazy[...]`, receives a proxy of the service
+_LAZY = "lazy"
+# instance of a pooled service is checked out for the duration of the call
+_POOLED = "pooled"
+
+_MISSING = object()
+_NOT_PASSED = object()
+
+
+class _ResolutionPlan:
+    """Per-parameter resolution steps of a decorated callable, valid until keys of the container change."""
+
+    __slots__ = ("layout", "steps", "awaitable", "pooled", "call", "positional")
+
+    def __init__(
+        self,
+        layout: int,
+        steps: Tuple[Tuple[str, str, Any], ...],
+        awaitable: Tuple[Tuple[int, str, Any], ...] = (),
+        pooled: Tuple[Tuple[int, str, Any], ...] = (),
+        call: Optional[Callable[..., Any]] = None,
+        positional: int = 0,
+    ):
+        self.layout = layout
+        self.steps = steps
+        # position, name and key of parameters resolved by asynchronous factories
+        self.awaitable = awaitable
+        # position, name and key of parameters checked out of pools
+        self.pooled = pooled
+        # `call(service, container, *args)` resolves arguments which were not passed straight into a positional call,
+        # it returns `_MISSING` without calling the service if some of them cannot be resolved
+        self.call = call
+        # number of leading parameters `call` accepts positionally
+        self.positional = positional
+
+
+class Injection:
+    """Dependencies of a service decorated with `@inject`, available as `__injection__` of the decorated callable."""
+
+    def __init__(self, service: Callable, container: Container, plan: Callable[[], _ResolutionPlan]):
+        self.service = service
+        self.container = container
+        self._plan = plan
+
+    def _steps(self) -> Tuple[Tuple[str, str, Any], ...]:
+        steps = self._plan().steps
+        # instance is always passed to constructors
+        if self.service.__name__ == "__init__":
+            return steps[1:]
+        return steps
+
+    def dependencies(self) -> Dict[str, Any]:
+        """Keys the service's parameters are currently resolved from, by parameter name.
+
+        Lazy parameters are left out, they are not needed to construct the service.
+        """
+        return {name: key for name, source, key in self._steps() if source not in (_FROM_DEFAULT, _UNRESOLVED, _LAZY)}
+
+    def unresolved(self) -> Tuple[str, ...]:
+        """Names of parameters which can be neither resolved from the container nor defaulted."""
+        return tuple(name for name, source, _ in self._steps() if source is _UNRESOLVED)
+
+    def pooled(self) -> Tuple[str, ...]:
+        """Names of parameters which receive instances checked out of pools."""
+        return tuple(name for name, source, _ in self._steps() if source is _POOLED)
+
+
+def _compile_plan(
     alias_map: Dict[str, str],
     parameters_name: Tuple[str, ...],
     parameters: Dict[str, Parameter],
     container: Container,
-) -> Dict[str, Any]:
-    resolved_kwargs = {}
+) -> _ResolutionPlan:
+    layout = container._layout
+    steps: List[Tuple[str, str, Any]] = []
     for name in parameters_name:
+        annotation = parameters[name].type
+        lazy = is_lazy(annotation)
+        if lazy:
+            annotation = unpack_lazy(annotation)
+
         if name in alias_map and alias_map[name] in container:
-            resolved_kwargs[name] = container[alias_map[name]]
-            continue
+            step: Tuple[str, str, Any] = (name, _FROM_ALIAS, alias_map[name])
+        elif name in container:
+            step = (name, _FROM_NAME, name)
+        elif annotation in container:
+            step = (name, _FROM_TYPE, annotation)
+        elif parameters[name].default is not Undefined:
+            step = (name, _FROM_DEFAULT, parameters[name].default)
+        else:
+            step = (name, _UNRESOLVED, None)
+
+        if lazy and step[1] not in (_FROM_DEFAULT, _UNRESOLVED):
+            step = (name, _LAZY, step[2])
+        elif step[1] not in (_FROM_DEFAULT, _UNRESOLVED) and container._pool_for(step[2]) is not None:
+            step = (name, _POOLED, step[2])
+        steps.append(step)
+
+    awaitable = tuple(
+        (position, name, key)
+        for position, (name, source, key) in enumerate(steps)
+        if source not in (_FROM_DEFAULT, _UNRESOLVED, _LAZY) and container.is_async(key)
+    )
+
+    pooled = tuple((position, name, key) for position, (name, source, key) in enumerate(steps) if source is _POOLED)
 
-        if name in container:
-            resolved_kwargs[name] = container[name]
-            continue
+    call, positional = None, 0
+    if not pooled:
+        call, positional = _compile_call(steps, [parameters[name].kind for name in parameters_name])
 
-        if parameters[name].type in container:
-            resolved_kwargs[name] = container[parameters[name].type]
-            continue
+    return _ResolutionPlan(layout, tuple(steps), awaitable, pooled, call, positional)
 
-        if parameters[name].default is not Undefined:
-            resolved_kwargs[name] = parameters[name].default
 
-    return resolved_kwargs
+_POSITIONAL_KINDS = (InspectParameter.POSITIONAL_ONLY, InspectParameter.POSITIONAL_OR_KEYWORD)
 
+# parameter resolved from the container by the generated call, from an alias, its name or its type
+_RESOLVED = "resolved"
 
-def _decorate(binding: Dict[str, Any], service: ServiceDefinition, container: Container) -> ServiceResult:
+# functions making generated calls, by the sources and keyword-only names of their parameters
+_call_makers: Dict[Tuple[Tuple[str, Optional[str]], ...], Callable[..., Callable[..., Any]]] = {}
+
+
+def _compile_call(steps: List[Tuple[str, str, Any]], kinds: List[Any]) -> Tuple[Optional[Callable[..., Any]], int]:
+    """Function calling the service with its parameters laid out positionally, filling in missing ones.
+
+    Services taking variadic arguments are not supported.
+    """
+    if any(kind not in _POSITIONAL_KINDS and kind is not InspectParameter.KEYWORD_ONLY for kind in kinds):
+        return None, 0
+
+    # generated code depends on where parameters come from and on names of keyword-only ones, but not on the keys
+    shape = tuple(
+        (
+            source if source in (_UNRESOLVED, _FROM_DEFAULT, _LAZY) else _RESOLVED,
+            None if kind in _POSITIONAL_KINDS else name,
+        )
+        for (name, source, _), kind in zip(steps, kinds)
+    )
+    make_call = _call_makers.get(shape)
+    if make_call is None:
+        make_call = _call_makers[shape] = _generate_call(shape)
+
+    # keys are bound as arguments, so plans recompiled with other keys reuse the generated code
+    call = make_call(*[key for name, source, key in steps if source is not _UNRESOLVED])
+    return call, sum(1 for kind in kinds if kind in _POSITIONAL_KINDS)
+
+
+def _generate_call(shape: Tuple[Tuple[str, Optional[str]], ...]) -> Callable[..., Callable[..., Any]]:
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_MISSING_SERVICE": _MISSING_SERVICE,
+        "_NOT_PASSED": _NOT_PASSED,
+        "_LazyProxy": LazyProxy,
+    }
+    keys = []
+    lines = []
+    arguments = []
+    for position, (source, keyword) in enumerate(shape):
+        argument = f"a{position}"
+        lines.append(f"        if {argument} is _NOT_PASSED:")
+        if source is _UNRESOLVED:
+            lines.append("            return _MISSING")
+        elif source is _FROM_DEFAULT:
+            keys.append(f"k{position}")
+            lines.append(f"            {argument} = k{position}")
+        elif source is _LAZY:
+            keys.append(f"k{position}")
+            lines.append(f"            {argument} = _LazyProxy(container, k{position})")
+        else:
+            keys.append(f"k{position}")
+            lines.append(f"            {argument} = container._resolve(k{position})")
+            lines.append(f"            if {argument} is _MISSING_SERVICE:")
+            lines.append("                return _MISSING")
+        arguments.append(argument if keyword is None else f"{keyword}={argument}")
+
+    positional = sum(1 for _, keyword in shape if keyword is None)
+    slots = [f"a{position}=_NOT_PASSED" for position in range(len(shape))]
+    if positional < len(slots):
+        slots.insert(positional, "*")
+    source = "\n".join(
+        [
+            f"def _make_call({', '.join(keys)}):",
+            f"    def _call(service, container, {', '.join(slots)}):",
+            *lines,
+            f"        return service({', '.join(arguments)})",
+            "    return _call",
+        ]
+    )
+    exec(source, namespace)
+
+    return namespace["_make_call"]
+
+
+def _decorate(
+    binding: Dict[str, Any], service: ServiceDefinition, container: Container, defer_inspection: bool = False
+) -> ServiceResult:
 
     # ignore abstract class initialiser and protocol initialisers
     if service in [ABC.__init__, _no_init] or service.__name__ in [
@@ -112,57 +294,181 @@ def _decorate(binding: Dict[str, Any], service: ServiceDefinition, container: Co
         return service
 
     # Add class definition to dependency injection
-    parameters_name, parameters = _inspect_function_arguments(service)
-
-    def _resolve_kwargs(args, kwargs) -> dict:
+    parameters_name: Tuple[str, ...] = ()
+    parameters: Dict[str, Parameter] = {}
+    positional_only: Tuple[str, ...] = ()
+    inspected = False
+    plan = _ResolutionPlan(-1, ())
+
+    def _introspect() -> None:
+        nonlocal parameters_name, parameters, positional_only, inspected
+        parameters_name, parameters = _inspect_function_arguments(service)
+        positional_only = tuple(
+            name for name in parameters_name if parameters[name].kind is InspectParameter.POSITIONAL_ONLY
+        )
+        # set last, other threads check it to tell whether the function was inspected
+        inspected = True
+
+    if not defer_inspection:
+        _introspect()
+
+    def _get_plan() -> _ResolutionPlan:
+        nonlocal plan
+        if not inspected:
+            _introspect()
+        # plans are compiled lazily and recompiled only when keys are registered, removed or change their kind,
+        # replacing services or clearing the cache keeps them
+        if plan.layout != container._layout:
+            plan = _compile_plan(binding, parameters_name, parameters, container)
+        return plan
+
+    def _resolve_kwargs(args, kwargs, checked_out: list) -> dict:
+        instrumentation = container.instrumentation
+        if instrumentation is None:
+            return _bind_kwargs(args, kwargs, checked_out)
+
+        start = perf_counter()
+        try:
+            return _bind_kwargs(args, kwargs, checked_out)
+        finally:
+            instrumentation.after_inject(service, perf_counter() - start)
+
+    def _bind_kwargs(args, kwargs, checked_out: list) -> dict:
         # attach named arguments
         passed_kwargs = {**kwargs}
 
         # resolve positional arguments
         if args:
-            for key, value in enumerate(args):
-                passed_kwargs[parameters_name[key]] = value
+            for position, value in enumerate(args):
+                passed_kwargs[parameters_name[position]] = value
 
         # prioritise passed kwargs and args resolving
         if set(passed_kwargs.keys()) == set(parameters_name):
             return passed_kwargs
 
-        resolved_kwargs = _resolve_function_kwargs(binding, parameters_name, parameters, container)
-
-        all_kwargs = {**resolved_kwargs, **passed_kwargs}
-
-        if len(all_kwargs) < len(parameters_name):
-            missing_parameters = [arg for arg in parameters_name if arg not in all_kwargs]
+        missing_parameters = []
+        for name, source, key in _get_plan().steps:
+            if name in passed_kwargs:
+                continue
+            if source is _FROM_DEFAULT:
+                passed_kwargs[name] = key
+                continue
+            if source is _LAZY:
+                passed_kwargs[name] = LazyProxy(container, key)
+                continue
+            if source is _POOLED:
+                # constructed services are memoized, so they would keep the instance after it is returned
+                if service.__name__ == "__init__":
+                    raise ResolverError(
+                        f"Service {key} is pooled and cannot be injected into the constructor of `{service.__qualname__}`."
+                    )
+                pool = container._pool_for(key)
+                if pool is not None:
+                    passed_kwargs[name] = pool.acquire()
+                    checked_out.append((pool, passed_kwargs[name]))
+                    continue
+            if source is not _UNRESOLVED:
+                value = container.get(key, _MISSING)
+                if value is not _MISSING:
+                    passed_kwargs[name] = value
+                    continue
+                # service was removed concurrently, fall back to the parameter's default
+                if parameters[name].default is not Undefined:
+                    passed_kwargs[name] = parameters[name].default
+                    continue
+            missing_parameters.append(name)
+
+        if missing_parameters:
             raise ExecutionError(
                 "Cannot execute function without required parameters. "
                 + f"Did you forget to bind the following parameters: `{'`, `'.join(missing_parameters)}` inside the service `{service}`?"
             )
 
-        return all_kwargs
+        return passed_kwargs
+
+    async def _resolve_kwargs_async(args, kwargs, checked_out: list) -> dict:
+        plan = _get_plan()
+        pending = [
+            (name, key) for position, name, key in plan.awaitable if position >= len(args) and name not in kwargs
+        ]
+        if pending:
+            # independent asynchronous dependencies are built concurrently
+            values = await asyncio.gather(*[container.resolve_async(key) for _, key in pending])
+            kwargs = {**kwargs, **{name: value for (name, _), value in zip(pending, values)}}
+
+        pooled = [(name, key) for position, name, key in plan.pooled if position >= len(args) and name not in kwargs]
+        if pooled:
+            kwargs = {**kwargs}
+            for name, key in pooled:
+                pool = container._pool_for(key)
+                if pool is not None:
+                    # waiting for a pooled instance doesn't block the event loop
+                    kwargs[name] = await pool.acquire_async()
+                    checked_out.append((pool, kwargs[name]))
+
+        return _resolve_kwargs(args, kwargs, checked_out)
 
     @wraps(service)
     def _decorated(*args, **kwargs):
+        if not inspected:
+            _introspect()
+
         # all arguments were passed
         if len(args) == len(parameters_name):
             return service(*args, **kwargs)
 
-        if parameters_name == tuple(kwargs.keys()):
+        if not kwargs and container.instrumentation is None:
+            plan = _get_plan()
+            # missing arguments are resolved straight into a positional call
+            if plan.call is not None and len(args) <= plan.positional:
+                result = plan.call(service, container, *args)
+                if result is not _MISSING:
+                    return result
+        elif kwargs.keys() == parameters.keys():
             return service(**kwargs)
 
-        all_kwargs = _resolve_kwargs(args, kwargs)
-        return service(**all_kwargs)
+        checked_out: list = []
+        try:
+            all_kwargs = _resolve_kwargs(args, kwargs, checked_out)
+            if positional_only:
+                return service(*[all_kwargs.pop(name) for name in positional_only], **all_kwargs)
+            return service(**all_kwargs)
+        finally:
+            # pooled instances are returned once the call is over
+            for pool, instance in checked_out:
+                pool.release(instance)
 
     @wraps(service)
     async def _async_decorated(*args, **kwargs):
+        if not inspected:
+            _introspect()
+
         # all arguments were passed
         if len(args) == len(parameters_name):
             return await service(*args)
 
-        if parameters_name == tuple(kwargs.keys()):
+        if not kwargs and container.instrumentation is None:
+            plan = _get_plan()
+            if plan.call is not None and not plan.awaitable and len(args) <= plan.positional:
+                result = plan.call(service, container, *args)
+                if result is not _MISSING:
+                    return await result
+        elif kwargs.keys() == parameters.keys():
             return await service(**kwargs)
 
-        all_kwargs = _resolve_kwargs(args, kwargs)
-        return await service(**all_kwargs)
+        checked_out: list = []
+        try:
+            all_kwargs = await _resolve_kwargs_async(args, kwargs, checked_out)
+            if positional_only:
+                return await service(*[all_kwargs.pop(name) for name in positional_only], **all_kwargs)
+            return await service(**all_kwargs)
+        finally:
+            for pool, instance in checked_out:
+                pool.release(instance)
+
+    injection = Injection(service, container, _get_plan)
+    _decorated.__injection__ = injection  # type: ignore
+    _async_decorated.__injection__ = injection  # type: ignore
 
     if asyncio.iscoroutinefunction(service):
         return _async_decorated
@@ -176,13 +482,20 @@ def inject(
     bind: Optional[Dict[str, Any]] = None,
     container: Container = di,
     use_factory: bool = False,
+    defer_inspection: bool = False,
 ) -> Union[ServiceResult, Callable[[ServiceDefinition], ServiceResult]]:
+    """Register the service in the container and inject its dependencies when it is called.
+
+    With `defer_inspection` set, the signature of the service is inspected on its first call instead of at
+    decoration time, which reduces import time of modules with many decorated services.
+    """
+
     def _decorator(_service: ServiceDefinition) -> ServiceResult:
         if isclass(_service):
             setattr(
                 _service,
                 "__init__",
-                _decorate(bind or {}, getattr(_service, "__init__"), container),
+                _decorate(bind or {}, getattr(_service, "__init__"), container, defer_inspection),
             )
             if use_factory:
                 container.factories[_service] = lambda _di: _service()
@@ -195,7 +508,7 @@ def inject(
 
             return _service
 
-        service_function = _decorate(bind or {}, _service, container)
+        service_function = _decorate(bind or {}, _service, container, defer_inspection)
         container[service_function.__name__] = service_function
         if alias:
             container.add_alias(alias, service_function.__name__)
@@ -208,4 +521,4 @@ def inject(
     return _decorator(_service)
 
 
-__all__ = ["inject"]
+__all__ = ["Injection", "inject"]
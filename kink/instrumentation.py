@@ -0,0 +1,133 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class Instrumentation:
+    """Receives events of an instrumented container, override the hooks you are interested in.
+
+    Times are given in seconds.
+    """
+
+    def before_resolve(self, key: Any) -> None:
+        """Called before the key is looked up in the container."""
+
+    def after_resolve(self, key: Any, found: bool, elapsed: float) -> None:
+        """Called after the key was looked up, `found` tells whether the container has resolved it."""
+
+    def after_construct(self, key: Any, elapsed: float) -> None:
+        """Called after a factory, lambda service or scoped service was called to create the key's service."""
+
+    def after_inject(self, service: Callable, elapsed: float) -> None:
+        """Called after missing arguments of the service decorated with `@inject` were resolved."""
+
+
+class KeyStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.constructions = 0
+        self.construction_time = 0.0
+        self.resolve_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "constructions": self.constructions,
+            "construction_time": self.construction_time,
+            "resolve_time": self.resolve_time,
+        }
+
+    def __repr__(self) -> str:
+        return f"KeyStats({', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())})"
+
+
+class InjectionStats:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.resolve_time = 0.0
+
+    def __repr__(self) -> str:
+        return f"InjectionStats(calls={self.calls!r}, resolve_time={self.resolve_time!r})"
+
+
+class ResolutionStats(Instrumentation):
+    """Collects per-key hit, miss and construction counters, and time spent in factories.
+
+    Nested lookups are timed as well, so `resolve_time` of a service includes resolving its dependencies.
+    """
+
+    def __init__(self) -> None:
+        self.keys: Dict[Any, KeyStats] = {}
+        self.injections: Dict[Callable, InjectionStats] = {}
+        self._lock = Lock()
+
+    def _key_stats(self, key: Any) -> KeyStats:
+        stats = self.keys.get(key)
+        if stats is None:
+            stats = self.keys.setdefault(key, KeyStats())
+        return stats
+
+    def after_resolve(self, key: Any, found: bool, elapsed: float) -> None:
+        with self._lock:
+            stats = self._key_stats(key)
+            if found:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            stats.resolve_time += elapsed
+
+    def after_construct(self, key: Any, elapsed: float) -> None:
+        with self._lock:
+            stats = self._key_stats(key)
+            stats.constructions += 1
+            stats.construction_time += elapsed
+
+    def after_inject(self, service: Callable, elapsed: float) -> None:
+        with self._lock:
+            stats = self.injections.get(service)
+            if stats is None:
+                stats = self.injections[service] = InjectionStats()
+            stats.calls += 1
+            stats.resolve_time += elapsed
+
+    def slowest(self, limit: int = 10) -> List[Tuple[Any, KeyStats]]:
+        """Keys which took the most time to construct, slowest first."""
+        with self._lock:
+            ranking = sorted(self.keys.items(), key=lambda item: item[1].construction_time, reverse=True)
+        return ranking[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.keys = {}
+            self.injections = {}
+
+
+def instrument_resolve(resolve: Callable[[Any], Any], instrumentation: Instrumentation, missing: Any) -> Callable:
+    def _resolve(key: Any) -> Any:
+        instrumentation.before_resolve(key)
+        found = False
+        start = perf_counter()
+        try:
+            service = resolve(key)
+            found = service is not missing
+            return service
+        finally:
+            instrumentation.after_resolve(key, found, perf_counter() - start)
+
+    return _resolve
+
+
+def instrument_construct(instrumentation: Instrumentation, container: Any) -> Callable:
+    def _construct(key: Any, factory: Callable[[Any], Any]) -> Any:
+        start = perf_counter()
+        try:
+            return factory(container)
+        finally:
+            instrumentation.after_construct(key, perf_counter() - start)
+
+    return _construct
+
+
+__all__ = ["Instrumentation", "InjectionStats", "KeyStats", "ResolutionStats"]
@@ -0,0 +1,57 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from kink.container import Container
+from kink.graph import DependencyGraph, _layers, _targets
+
+
+def _services_of(container: Container, key: Any) -> List[Any]:
+    """Registered services the key stands for, all services aliased by it in case of an alias."""
+    for layer in _layers(container):
+        if layer._registers(key):
+            return [key]
+
+        if key in layer._aliases:
+            return [target for alias in layer._aliases[key] for target in _targets(layer, alias)]
+
+    return _targets(container, key)
+
+
+def _owning_layer(container: Container, key: Any) -> Optional[Container]:
+    for layer in _layers(container):
+        if layer._registers(key):
+            return layer
+    return None
+
+
+def invalidate(
+    container: Container, keys: Iterable[Any], where: Optional[Callable[[Any], bool]], cascade: bool
+) -> List[Any]:
+    services = [service for key in keys for service in _services_of(container, key)]
+    if where is not None:
+        services += [key for layer in _layers(container) for key in layer._local_keys() if where(key)]
+    if cascade:
+        services += DependencyGraph.build(container).dependents(services)
+
+    invalidated = []
+    # invalidated keys of each changed layer
+    changed_layers: Dict[Container, List[Any]] = {}
+    for key in dict.fromkeys(services):
+        layer = _owning_layer(container, key)
+        if layer is None:
+            continue
+
+        # waits for a construction of the service in progress, so it doesn't get memoized afterwards
+        with layer._lock_for(key):
+            if not layer._is_memoized(key):
+                continue
+            layer._forget_memoized(key)
+            layer._forget_alias_lists(key)
+        invalidated.append(key)
+        changed_layers.setdefault(layer, []).append(key)
+
+    # subscribers holding resolved services re-resolve them, children are notified by their parents
+    for layer, layer_keys in changed_layers.items():
+        with layer._mutation_lock:
+            layer._changed(structural=False, keys=layer_keys)
+
+    return invalidated
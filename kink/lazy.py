@@ -0,0 +1,93 @@
+from typing import Any, TypeVar
+
+from typing_extensions import Annotated
+
+from kink.typing_support import key_name
+
+T = TypeVar("T")
+
+
+class _LazyMarker:
+    def __repr__(self) -> str:
+        return "kink.Lazy"
+
+
+_LAZY = _LazyMarker()
+_UNRESOLVED = object()
+
+# `Lazy[Service]` is `Annotated[Service, kink.Lazy]`, so type checkers treat the parameter as `Service`
+Lazy = Annotated[T, _LAZY]
+
+
+def is_lazy(type_name: Any) -> bool:
+    return _LAZY in getattr(type_name, "__metadata__", ())
+
+
+def unpack_lazy(type_name: Any) -> Any:
+    return type_name.__origin__
+
+
+class LazyProxy:
+    """Stands in for a dependency and resolves it from the container on first use."""
+
+    __slots__ = ("_kink_container", "_kink_key", "_kink_service")
+
+    def __init__(self, container: Any, key: Any):
+        object.__setattr__(self, "_kink_container", container)
+        object.__setattr__(self, "_kink_key", key)
+        object.__setattr__(self, "_kink_service", _UNRESOLVED)
+
+    def _kink_resolve(self) -> Any:
+        service = self._kink_service
+        if service is _UNRESOLVED:
+            service = self._kink_container[self._kink_key]
+            object.__setattr__(self, "_kink_service", service)
+        return service
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._kink_resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._kink_resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._kink_resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._kink_resolve()(*args, **kwargs)
+
+    def __getitem__(self, item: Any) -> Any:
+        return self._kink_resolve()[item]
+
+    def __iter__(self) -> Any:
+        return iter(self._kink_resolve())
+
+    def __len__(self) -> int:
+        return len(self._kink_resolve())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._kink_resolve()
+
+    def __bool__(self) -> bool:
+        return bool(self._kink_resolve())
+
+    def __enter__(self) -> Any:
+        return self._kink_resolve().__enter__()
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        return self._kink_resolve().__exit__(*exc_info)
+
+    def __repr__(self) -> str:
+        if self._kink_service is not _UNRESOLVED:
+            return repr(self._kink_service)
+        return f"<LazyProxy {key_name(self._kink_key)}>"
+
+
+def resolve_lazy(value: Any) -> Any:
+    """Returns the service behind a lazy proxy, resolving it if needed, or the value itself."""
+    if isinstance(value, LazyProxy):
+        return value._kink_resolve()
+    return value
+
+
+__all__ = ["Lazy", "LazyProxy", "resolve_lazy"]
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Dict, List, Set
+
+from kink.container import Container, _ManagedInstance
+from kink.errors.resolver_error import ResolverError
+from kink.graph import DependencyGraph
+from kink.invalidation import invalidate
+from kink.warm_up import _prerequisites
+
+
+def _take_managed(container: Container) -> List[_ManagedInstance]:
+    instances, container._managed = container._managed, []
+    # closed services and services holding them are created again when requested, subscribers are notified
+    invalidate(container, dict.fromkeys(instance.key for instance in instances), None, cascade=True)
+    return instances
+
+
+def _teardown_batches(container: Container, instances: List[_ManagedInstance]) -> List[List[_ManagedInstance]]:
+    """Instances grouped so that each group only depends on instances of the groups after it."""
+    graph = DependencyGraph.build(container)
+    managed_keys = {instance.key for instance in instances}
+    positions = {id(instance): position for position, instance in enumerate(instances)}
+    by_key: Dict[Any, List[int]] = {}
+    for position, instance in enumerate(instances):
+        by_key.setdefault(instance.key, []).append(position)
+
+    # every instance depends on instances entered before it only, so the dependencies cannot form a cycle
+    dependencies: List[Set[int]] = []
+    for position, instance in enumerate(instances):
+        depends_on = {positions[id(entered)] for entered in instance.entered_within if id(entered) in positions}
+        for key in _prerequisites(graph, instance.key, managed_keys):
+            depends_on.update(dependency for dependency in by_key[key] if dependency < position)
+        dependencies.append(depends_on)
+
+    dependents = [0] * len(instances)
+    for depends_on in dependencies:
+        for dependency in depends_on:
+            dependents[dependency] += 1
+
+    batches = []
+    ready = [position for position in range(len(instances)) if not dependents[position]]
+    while ready:
+        batches.append([instances[position] for position in sorted(ready, reverse=True)])
+        released = []
+        for position in ready:
+            for dependency in dependencies[position]:
+                dependents[dependency] -= 1
+                if not dependents[dependency]:
+                    released.append(dependency)
+        ready = released
+    return batches
+
+
+def close(container: Container) -> None:
+    if any(instance.asynchronous for instance in container._managed):
+        raise ResolverError("Container has asynchronous managed services, use `await container.aclose()` instead.")
+
+    instances = _take_managed(container)
+    errors = []
+    for batch in _teardown_batches(container, instances):
+        for instance in batch:
+            try:
+                instance.manager.__exit__(None, None, None)
+            except Exception as error:
+                errors.append(error)
+
+    # every service is closed even if some of them failed to
+    if errors:
+        raise errors[0]
+
+
+async def _exit(instance: _ManagedInstance) -> None:
+    if instance.asynchronous:
+        await instance.manager.__aexit__(None, None, None)
+    else:
+        await asyncio.get_running_loop().run_in_executor(None, instance.manager.__exit__, None, None, None)
+
+
+async def aclose(container: Container) -> None:
+    instances = _take_managed(container)
+    errors = []
+    for batch in _teardown_batches(container, instances):
+        results = await asyncio.gather(*[_exit(instance) for instance in batch], return_exceptions=True)
+        errors += [result for result in results if isinstance(result, Exception)]
+
+    if errors:
+        raise errors[0]
@@ -0,0 +1,195 @@
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from kink.errors.pool_timeout_error import PoolTimeoutError
+
+_CREATE = object()
+_EMPTY = object()
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self.created = 0
+        self.acquisitions = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "acquisitions": self.acquisitions,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+    def __repr__(self) -> str:
+        return f"PoolStats({', '.join(f'{name}={value!r}' for name, value in self.as_dict().items())})"
+
+
+class Pool:
+    """Bounded pool of instances of a service, created on demand up to `max_size`.
+
+    Instances are checked out for exclusive use and returned afterwards. When all of them are
+    in use, `acquire` waits for one to be released, at most `timeout` seconds if given.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_size: int, timeout: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("Maximum size of the pool must be positive.")
+        self.max_size = max_size
+        self.timeout = timeout
+        self.stats = PoolStats()
+        self._factory = factory
+        # idle instances are reused last in, first out, so the most recently used ones stay warm
+        self._idle: List[Any] = []
+        self._size = 0
+        self._condition = Condition()
+        # coroutines waiting for an instance, each woken on its own event loop
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+
+    @property
+    def size(self) -> int:
+        """Number of instances created by the pool, both idle and in use."""
+        return self._size
+
+    @property
+    def in_use(self) -> int:
+        return self._size - len(self._idle)
+
+    def _take(self) -> Any:
+        if self._idle:
+            return self._idle.pop()
+        if self._size < self.max_size:
+            self._size += 1
+            return _CREATE
+        return _EMPTY
+
+    def acquire(self) -> Any:
+        with self._condition:
+            instance = self._take()
+            if instance is _EMPTY:
+                instance = self._wait()
+            self.stats.acquisitions += 1
+
+        return self._create() if instance is _CREATE else instance
+
+    def _wait(self) -> Any:
+        start = perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+        self.stats.waits += 1
+        instance = _EMPTY
+        try:
+            while instance is _EMPTY:
+                remaining = None if deadline is None else deadline - perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._timed_out()
+                self._condition.wait(remaining)
+                instance = self._take()
+            return instance
+        finally:
+            self._waited(start)
+
+    def _timed_out(self) -> None:
+        self.stats.timeouts += 1
+        raise PoolTimeoutError(f"No instance was released by the pool within {self.timeout} seconds.")
+
+    def _waited(self, start: float) -> None:
+        waited = perf_counter() - start
+        self.stats.wait_time += waited
+        self.stats.max_wait_time = max(self.stats.max_wait_time, waited)
+
+    def _notify(self) -> None:
+        # called holding the condition, a released instance or slot is offered to a waiting thread and coroutine
+        self._condition.notify()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+                return
+            except RuntimeError:  # event loop of the waiter is closed
+                continue
+
+    def _create(self) -> Any:
+        try:
+            instance = self._factory()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._notify()
+            raise
+
+        with self._condition:
+            self.stats.created += 1
+        return instance
+
+    async def acquire_async(self) -> Any:
+        """Acquire an instance without blocking the event loop while waiting for one.
+
+        Waiting coroutines don't occupy any threads, they are woken on their event loop when an instance is released.
+        """
+        loop = asyncio.get_running_loop()
+        start = deadline = None
+        try:
+            while True:
+                with self._condition:
+                    instance = self._take()
+                    if instance is not _EMPTY:
+                        self.stats.acquisitions += 1
+                        break
+                    if start is None:
+                        start = perf_counter()
+                        deadline = None if self.timeout is None else start + self.timeout
+                        self.stats.waits += 1
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+
+                try:
+                    await asyncio.wait_for(waiter, None if deadline is None else max(deadline - perf_counter(), 0))
+                except asyncio.TimeoutError:
+                    self._abandon(loop, waiter)
+                    self._timed_out()
+                except BaseException:
+                    self._abandon(loop, waiter)
+                    raise
+        finally:
+            if start is not None:
+                self._waited(start)
+
+        return self._create() if instance is _CREATE else instance
+
+    def _abandon(self, loop: asyncio.AbstractEventLoop, waiter: "asyncio.Future[None]") -> None:
+        with self._condition:
+            try:
+                self._async_waiters.remove((loop, waiter))
+            except ValueError:
+                # the waiter was already woken, the wake up is passed on so it doesn't get lost
+                self._notify()
+
+    def release(self, instance: Any) -> None:
+        with self._condition:
+            self._idle.append(instance)
+            self._notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        instance = self.acquire()
+        try:
+            yield instance
+        finally:
+            self.release(instance)
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+__all__ = ["Pool", "PoolStats"]
@@ -0,0 +1,95 @@
+import json
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from kink.instrumentation import Instrumentation
+from kink.typing_support import key_name
+
+
+class ProfileNode:
+    """Resolutions of a key reached through the same chain of dependencies."""
+
+    def __init__(self, key: Any, parent: Optional["ProfileNode"] = None):
+        self.key = key
+        self.parent = parent
+        self.calls = 0
+        self.constructions = 0
+        self.total_time = 0.0
+        self.children: Dict[Any, ProfileNode] = {}
+
+    @property
+    def self_time(self) -> float:
+        return max(self.total_time - sum(child.total_time for child in self.children.values()), 0.0)
+
+    @property
+    def name(self) -> str:
+        return key_name(self.key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.name,
+            "calls": self.calls,
+            "constructions": self.constructions,
+            "total_time": self.total_time,
+            "self_time": self.self_time,
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+
+class ResolutionProfiler(Instrumentation):
+    """Records the tree of nested resolutions and attributes self and cumulative time to its nodes.
+
+    When a service is constructed, services resolved by its factory or injected into its constructor
+    become its children, eg. `A` -> `B` -> `C` when `A.__init__` is injected with `B` which needs `C`.
+    """
+
+    def __init__(self) -> None:
+        self.root = ProfileNode("<root>")
+        self._current: ContextVar[ProfileNode] = ContextVar(f"kink_profile_{id(self)}", default=self.root)
+        self._lock = Lock()
+
+    def before_resolve(self, key: Any) -> None:
+        parent = self._current.get()
+        with self._lock:
+            node = parent.children.get(key)
+            if node is None:
+                node = parent.children[key] = ProfileNode(key, parent)
+        self._current.set(node)
+
+    def after_resolve(self, key: Any, found: bool, elapsed: float) -> None:
+        node = self._current.get()
+        self._current.set(node.parent or self.root)
+        with self._lock:
+            node.calls += 1
+            node.total_time += elapsed
+
+    def after_construct(self, key: Any, elapsed: float) -> None:
+        node = self._current.get()
+        if node.key == key:
+            with self._lock:
+                node.constructions += 1
+
+    def folded(self) -> str:
+        """Self time of every chain of resolutions in microseconds, in the folded stacks format of flamegraphs."""
+        lines = []
+        stack = [(child, [child.name]) for child in self.root.children.values()]
+        while stack:
+            node, path = stack.pop()
+            frames = ";".join(frame.replace(";", ",").replace(" ", "") for frame in path)
+            lines.append(f"{frames} {round(node.self_time * 1e6)}")
+            stack.extend((child, path + [child.name]) for child in node.children.values())
+        return "\n".join(sorted(lines))
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        return [child.to_dict() for child in self.root.children.values()]
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.root.children = {}
+
+
+__all__ = ["ProfileNode", "ResolutionProfiler"]
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Optional, Type, Union
+import collections.abc
+from typing import Any, Dict, ForwardRef, List, Optional, Tuple, Type, Union
+
+try:
+    from types import UnionType  # type: ignore
+except ImportError:  # python < 3.10
+    UnionType = None  # type: ignore
+
+_NONE_TYPE = type(None)
 
 
 def get_origin_type(type_name: Type) -> Optional[Type]:
@@ -11,13 +19,80 @@ def get_type_args(type_name: Type) -> List[Type]:
     return getattr(type_name, "__args__", [])
 
 
+def _is_union(type_name: Type) -> bool:
+    return get_origin_type(type_name) is Union or (UnionType is not None and isinstance(type_name, UnionType))
+
+
 def is_optional(type_name: Type) -> bool:
-    return (
-        get_origin_type(type_name) is Union
-        and bool(get_type_args(type_name))
-        and get_type_args(type_name)[-1] is type(None)  # noqa
-    )
+    return _is_union(type_name) and _NONE_TYPE in get_type_args(type_name)
 
 
 def unpack_optional(type_name: Type) -> Type:
-    return get_type_args(type_name)[0]
+    return next(arg for arg in get_type_args(type_name) if arg is not _NONE_TYPE)
+
+
+# kinds of keys, telling how the canonical key of `normalize_key` is resolved
+KEY_PLAIN = "plain"
+KEY_ANNOTATED = "annotated"
+KEY_OPTIONAL = "optional"
+KEY_SEQUENCE = "sequence"
+
+_SEQUENCE_ORIGINS = (list, collections.abc.Sequence)
+
+# typing objects hash slowly, so normalized keys are cached by identity, entries keep their keys alive
+_normalized: Dict[int, Tuple[Any, Any, str]] = {}
+# equal typing keys created anew, like `list[X]`, get new identities, so the cache is bounded
+_NORMALIZED_MAX_SIZE = 4096
+
+
+def _normalize(key: Any) -> Tuple[Any, str]:
+    if hasattr(key, "__metadata__"):
+        canonical, kind = _normalize(key.__origin__)
+        return canonical, KEY_ANNOTATED if kind is KEY_PLAIN else kind
+
+    if _is_union(key):
+        args = tuple(arg for arg in get_type_args(key) if arg is not _NONE_TYPE)
+        if len(args) == len(get_type_args(key)):
+            return key, KEY_PLAIN
+        # like `unpack_optional`, the first of many types is used
+        inner = args[0]
+        if hasattr(inner, "__metadata__"):
+            inner = _normalize(inner)[0]
+        return inner, KEY_OPTIONAL
+
+    if get_origin_type(key) in _SEQUENCE_ORIGINS and len(get_type_args(key)) == 1:
+        item = get_type_args(key)[0]
+        if isinstance(item, ForwardRef):
+            item = item.__forward_arg__
+        return item, KEY_SEQUENCE
+
+    return key, KEY_PLAIN
+
+
+def normalize_key(key: Any) -> Tuple[Any, str]:
+    """Canonical form of a container key and the kind of the key.
+
+    `Annotated[X, ...]` is `X`, `Optional[X]` and `X | None` are optional `X`, and `List[X]` and `Sequence[X]`
+    are sequences of services aliased as `X`. Results for typing keys are cached.
+    """
+    if type(key) is str or type(key) is type:
+        return key, KEY_PLAIN
+
+    cached = _normalized.get(id(key))
+    if cached is not None and cached[0] is key:
+        return cached[1], cached[2]
+
+    canonical, kind = _normalize(key)
+    if len(_normalized) >= _NORMALIZED_MAX_SIZE:
+        _normalized.clear()
+    _normalized[id(key)] = (key, canonical, kind)
+    return canonical, kind
+
+
+def key_name(key: Any) -> str:
+    """Human readable name of a container key."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, type):
+        return key.__qualname__
+    return repr(key).replace("typing.", "")
@@ -0,0 +1,90 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from kink.container import Container, _is_lambda
+from kink.graph import DependencyGraph, _layers, _targets
+
+
+def _memoizing_layer(container: Container, key: Any) -> Optional[Container]:
+    """Layer which memoizes the service registered under the key, if the service is memoized at all."""
+    for layer in _layers(container):
+        if layer._registers(key):
+            if key in layer._factories or not _is_lambda(layer._services.get(key)):
+                return None
+            return layer
+    return None
+
+
+def _services_to_warm_up(container: Container, keys: Optional[Iterable[Any]]) -> Tuple[DependencyGraph, List[Any]]:
+    graph = DependencyGraph.build(container)
+    if keys is not None:
+        keys = [target for key in keys for target in _targets(container, key)]
+
+    services = []
+    for key in graph.topological_order(keys):
+        layer = _memoizing_layer(container, key)
+        if layer is not None and not layer._is_memoized(key):
+            services.append(key)
+
+    return graph, services
+
+
+def _prerequisites(graph: DependencyGraph, key: Any, services: Set[Any]) -> Set[Any]:
+    """Services being warmed up which the key depends on, directly or through services which are not warmed up."""
+    prerequisites = set()
+    visited = set()
+    stack = list(graph.dependencies(key))
+    while stack:
+        dependency = stack.pop()
+        if dependency in visited:
+            continue
+        visited.add(dependency)
+        if dependency in services:
+            prerequisites.add(dependency)
+        else:
+            stack.extend(graph.dependencies(dependency))
+    return prerequisites
+
+
+def _create(container: Container, key: Any) -> float:
+    start = perf_counter()
+    container[key]
+    return perf_counter() - start
+
+
+def warm_up(container: Container, keys: Optional[Iterable[Any]] = None, max_workers: int = 1) -> Dict[Any, float]:
+    graph, services = _services_to_warm_up(container, keys)
+    if max_workers <= 1:
+        return {key: _create(container, key) for key in services}
+
+    return _warm_up_concurrently(container, graph, services, max_workers)
+
+
+def _warm_up_concurrently(
+    container: Container, graph: DependencyGraph, services: List[Any], max_workers: int
+) -> Dict[Any, float]:
+    selected = set(services)
+    waiting_for = {key: len(_prerequisites(graph, key, selected)) for key in services}
+    dependents: Dict[Any, List[Any]] = {key: [] for key in services}
+    for key in services:
+        for prerequisite in _prerequisites(graph, key, selected):
+            dependents[prerequisite].append(key)
+
+    timings = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kink-warm-up") as executor:
+        running: Dict[Future, Any] = {
+            executor.submit(_create, container, key): key for key in services if not waiting_for[key]
+        }
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                timings[key] = future.result()
+                # dependents are started once all services they depend on were created
+                for dependent in dependents[key]:
+                    waiting_for[dependent] -= 1
+                    if not waiting_for[dependent]:
+                        running[executor.submit(_create, container, dependent)] = dependent
+
+    return timings
@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+
+from kink import Container, inject
+from kink.errors import ResolverError
+
+
+class Pool:
+    ...
+
+
+class Session:
+    ...
+
+
+def test_resolve_async_service_once() -> None:
+    container = Container()
+    constructions = []
+
+    async def create_pool(di: Container) -> Pool:
+        constructions.append(1)
+        return Pool()
+
+    container.add_async(Pool, create_pool)
+
+    async def _run() -> None:
+        pool = await container.resolve_async(Pool)
+        assert pool is await container.resolve_async(Pool)
+
+    asyncio.run(_run())
+
+    assert Pool in container
+    assert container.is_async(Pool)
+    assert len(constructions) == 1
+
+
+def test_resolve_async_factory_every_time() -> None:
+    container = Container()
+
+    async def create_session(di: Container) -> Session:
+        return Session()
+
+    container.add_async(Session, create_session, use_factory=True)
+
+    async def _run() -> None:
+        assert await container.resolve_async(Session) is not await container.resolve_async(Session)
+
+    asyncio.run(_run())
+
+
+def test_resolve_async_falls_back_to_sync_services() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+
+    assert asyncio.run(container.resolve_async("dsn")) == "postgres://"
+
+
+def test_cannot_resolve_async_service_synchronously_before_it_is_built() -> None:
+    container = Container()
+
+    async def create_pool(di: Container) -> Pool:
+        return Pool()
+
+    container.add_async(Pool, create_pool)
+
+    with pytest.raises(ResolverError):
+        container[Pool]
+
+    pool = asyncio.run(container.resolve_async(Pool))
+
+    assert container[Pool] is pool
+
+
+def test_async_factories_can_use_container() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+
+    async def create_pool(di: Container) -> dict:
+        return {"dsn": di["dsn"]}
+
+    container.add_async("pool", create_pool)
+    container.add_alias("database", "pool")
+
+    assert asyncio.run(container.resolve_async("database")) == {"dsn": "postgres://"}
+
+
+def test_inject_async_dependencies_concurrently() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    started = []
+
+    async def _both_started() -> None:
+        # each factory waits for the other one, so they complete only if they run concurrently
+        started.append(1)
+        while len(started) < 2:
+            await asyncio.sleep(0)
+
+    async def create_pool(di: Container) -> Pool:
+        await _both_started()
+        return Pool()
+
+    async def create_session(di: Container) -> Session:
+        await _both_started()
+        return Session()
+
+    container.add_async(Pool, create_pool)
+    container.add_async(Session, create_session, use_factory=True)
+
+    @inject(container=container)
+    async def handler(name: str, pool: Pool, session: Session) -> tuple:
+        return name, pool, session
+
+    name, pool, session = asyncio.run(asyncio.wait_for(handler(), 5))
+
+    assert name == "Bob"
+    assert isinstance(pool, Pool)
+    assert isinstance(session, Session)
+
+
+def test_passed_arguments_are_not_resolved_asynchronously() -> None:
+    container = Container()
+
+    async def create_pool(di: Container) -> Pool:
+        raise AssertionError("should not be called")
+
+    container.add_async(Pool, create_pool)
+    given_pool = Pool()
+
+    @inject(container=container)
+    async def handler(pool: Pool, name: str = "Tom") -> tuple:
+        return pool, name
+
+    assert asyncio.run(handler(given_pool)) == (given_pool, "Tom")
+    assert asyncio.run(handler(pool=given_pool)) == (given_pool, "Tom")
+
+
+def test_concurrent_resolvers_share_single_construction() -> None:
+    container = Container()
+    constructions = []
+
+    async def create_pool(di: Container) -> Pool:
+        constructions.append(1)
+        await asyncio.sleep(0.01)
+        return Pool()
+
+    container.add_async(Pool, create_pool)
+
+    async def _run() -> list:
+        return await asyncio.gather(*[container.resolve_async(Pool) for _ in range(50)])
+
+    pools = asyncio.run(_run())
+
+    assert len(constructions) == 1
+    assert all(pool is pools[0] for pool in pools)
+
+
+def test_failed_construction_is_propagated_to_all_waiters_and_not_cached() -> None:
+    container = Container()
+    attempts = []
+
+    async def create_pool(di: Container) -> Pool:
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise ConnectionError("database is down")
+        return Pool()
+
+    container.add_async(Pool, create_pool)
+
+    async def _run() -> list:
+        return await asyncio.gather(*[container.resolve_async(Pool) for _ in range(10)], return_exceptions=True)
+
+    results = asyncio.run(_run())
+
+    assert len(attempts) == 1
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert isinstance(asyncio.run(container.resolve_async(Pool)), Pool)
+    assert len(attempts) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_construction() -> None:
+    container = Container()
+
+    async def create_pool(di: Container) -> Pool:
+        await asyncio.sleep(0.02)
+        return Pool()
+
+    container.add_async(Pool, create_pool)
+
+    async def _run() -> Pool:
+        first = asyncio.ensure_future(container.resolve_async(Pool))
+        second = asyncio.ensure_future(container.resolve_async(Pool))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert isinstance(asyncio.run(_run()), Pool)
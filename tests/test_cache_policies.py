@@ -0,0 +1,154 @@
+import gc
+from typing import List
+
+import pytest
+
+from kink import CachePolicy, Container, LRUPolicy, TTLPolicy, WeakPolicy
+
+
+class Client:
+    def __init__(self, tenant: str):
+        self.tenant = tenant
+
+
+def test_lru_policy_evicts_least_recently_used_service() -> None:
+    container = Container()
+    container["created"] = []
+    for tenant in ["a", "b", "c"]:
+        container[f"client:{tenant}"] = lambda di, tenant=tenant: di["created"].append(tenant) or Client(tenant)
+    policy = LRUPolicy(max_size=2)
+    for tenant in ["a", "b", "c"]:
+        container.set_cache_policy(f"client:{tenant}", policy)
+
+    client_a = container["client:a"]
+    container["client:b"]
+    assert container["client:a"] is client_a
+    container["client:c"]  # evicts b
+
+    assert len(policy) == 2
+    assert container["client:a"] is client_a
+    container["client:b"]
+    assert container["created"] == ["a", "b", "c", "b"]
+
+
+def test_ttl_policy_refreshes_expired_service() -> None:
+    now = [0.0]
+    container = Container()
+    container["created"] = []
+    container["client:a"] = lambda di: di["created"].append("a") or Client("a")
+    container.set_cache_policy("client:a", TTLPolicy(ttl=10, clock=lambda: now[0]))
+
+    client = container["client:a"]
+    now[0] = 9.0
+    assert container["client:a"] is client
+    now[0] = 10.0
+
+    assert container["client:a"] is not client
+    assert container["created"] == ["a", "a"]
+
+
+def test_weak_policy_drops_unreferenced_service() -> None:
+    container = Container()
+    container["created"] = []
+    container["client:a"] = lambda di: di["created"].append("a") or Client("a")
+    container.set_cache_policy("client:a", WeakPolicy())
+
+    client = container["client:a"]
+    assert container["client:a"] is client
+
+    del client
+    gc.collect()
+    container["client:a"]
+
+    assert container["created"] == ["a", "a"]
+
+
+def test_services_without_policy_are_memoized_as_before() -> None:
+    container = Container()
+    container["created"] = []
+    for tenant in ["a", "b"]:
+        container[f"client:{tenant}"] = lambda di, tenant=tenant: di["created"].append(tenant) or Client(tenant)
+    container.set_cache_policy("client:a", LRUPolicy(max_size=1))
+
+    client_b = container["client:b"]
+    container["client:a"]
+
+    assert container["client:b"] is client_b
+    assert container["created"] == ["b", "a"]
+
+
+def test_policy_is_cleared_with_container_cache_and_replaced_service() -> None:
+    container = Container()
+    container["created"] = []
+    container["client:a"] = lambda di: di["created"].append("a") or Client("a")
+    policy = LRUPolicy(max_size=10)
+    container.set_cache_policy("client:a", policy)
+
+    container["client:a"]
+    container.clear_cache()
+    assert len(policy) == 0
+
+    container["client:a"]
+    container["client:a"] = lambda di: Client("replaced")
+    assert container["client:a"].tenant == "replaced"
+
+    del container["client:a"]
+    assert len(policy) == 0
+
+
+def test_cache_policy_applies_to_frozen_container() -> None:
+    container = Container()
+    container["created"] = []
+    container["client:a"] = lambda di: di["created"].append("a") or Client("a")
+    policy = LRUPolicy(max_size=1)
+    container.set_cache_policy("client:a", policy)
+    container.freeze()
+
+    client = container["client:a"]
+    policy.clear()
+
+    assert container["client:a"] is not client
+
+
+def test_alias_list_follows_evicted_services() -> None:
+    now = [0.0]
+    container = Container()
+    container["created"] = []
+    container["client:a"] = lambda di: di["created"].append("a") or Client("a")
+    container.add_alias(Client, "client:a")
+    container.set_cache_policy("client:a", TTLPolicy(ttl=10, clock=lambda: now[0]))
+
+    client = container[List[Client]][0]
+    assert container[List[Client]][0] is client
+    now[0] = 10.0
+
+    assert container[List[Client]][0] is container["client:a"]
+    assert container[List[Client]][0] is not client
+    assert container["created"] == ["a", "a"]
+
+
+def test_alias_list_memoized_before_setting_policy_is_dropped() -> None:
+    container = Container()
+    container["client:a"] = lambda di: Client("a")
+    container.add_alias(Client, "client:a")
+    client = container[List[Client]][0]
+    notified: List[Container] = []
+    container.subscribe(notified.append)
+    generation = container.generation
+
+    policy = LRUPolicy(max_size=1)
+    container.set_cache_policy("client:a", policy)
+    policy.clear()
+
+    assert notified == [container]
+    assert container.generation > generation
+    assert container[List[Client]][0] is not client
+
+
+def test_invalid_policies() -> None:
+    with pytest.raises(ValueError):
+        LRUPolicy(max_size=0)
+    with pytest.raises(ValueError):
+        TTLPolicy(ttl=0)
+    with pytest.raises(TypeError):
+        CachePolicy()  # type: ignore
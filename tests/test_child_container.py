@@ -0,0 +1,178 @@
+import asyncio
+import gc
+from typing import List, Optional
+
+import pytest
+
+from kink import ChildContainer, Container, inject
+from kink.errors import ServiceError
+
+
+class Database:
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+
+
+class Plugin:
+    ...
+
+
+def test_child_resolves_services_of_parent() -> None:
+    parent = Container()
+    parent["dsn"] = "postgres://shared"
+    parent[Database] = lambda di: Database(di["dsn"])
+
+    child = parent.child()
+
+    assert isinstance(child, ChildContainer)
+    assert child.parent is parent
+    assert "dsn" in child
+    assert child["dsn"] == "postgres://shared"
+    assert child[Database] is parent[Database]
+    assert child[Optional[Database]] is parent[Database]
+
+
+def test_child_overrides_parent_services() -> None:
+    parent = Container()
+    parent["dsn"] = "postgres://shared"
+    child = parent.child()
+    child["dsn"] = "postgres://tenant"
+
+    assert child["dsn"] == "postgres://tenant"
+    assert parent["dsn"] == "postgres://shared"
+
+
+def test_services_are_memoized_in_layer_they_are_registered_in() -> None:
+    parent = Container()
+    parent["dsn"] = "postgres://shared"
+    parent[Database] = lambda di: Database(di["dsn"])
+    first = parent.child()
+    second = parent.child()
+    first["tenant_db"] = lambda di: Database("postgres://tenant")
+
+    assert first[Database] is second[Database]
+    assert first["tenant_db"] is first["tenant_db"]
+    assert "tenant_db" not in parent
+    assert "tenant_db" not in second
+
+
+def test_child_layered_on_child() -> None:
+    root = Container()
+    root["a"] = "root a"
+    root["b"] = "root b"
+    middle = root.child()
+    middle["b"] = "middle b"
+    leaf = middle.child()
+    leaf.factories["c"] = lambda di: di["a"] + " " + di["b"]
+
+    assert leaf["a"] == "root a"
+    assert leaf["b"] == "middle b"
+    assert leaf["c"] == "root a middle b"
+
+    with pytest.raises(ServiceError):
+        leaf["missing"]
+
+
+def test_child_sees_parent_changes() -> None:
+    parent = Container()
+    child = parent.child()
+    generation = child.generation
+
+    assert "dsn" not in child
+
+    parent["dsn"] = "postgres://shared"
+
+    assert child.generation > generation
+    assert child["dsn"] == "postgres://shared"
+
+    del parent["dsn"]
+
+    assert "dsn" not in child
+
+
+def test_child_aliases_can_target_parent_services() -> None:
+    class IDatabase:
+        ...
+
+    parent = Container()
+    parent[Database] = lambda di: Database("postgres://shared")
+    child = parent.child()
+    child.add_alias(IDatabase, Database)
+
+    assert child[IDatabase] is parent[Database]
+    assert child[List[IDatabase]] == [parent[Database]]
+
+
+def test_parent_alias_lists_are_resolved_from_parent() -> None:
+    class PluginA(Plugin):
+        ...
+
+    parent = Container()
+    parent[PluginA] = PluginA()
+    parent.add_alias(Plugin, PluginA)
+    child = parent.child()
+
+    assert child[List[Plugin]] == [parent[PluginA]]
+
+
+def test_child_alias_lists_follow_parent_changes() -> None:
+    parent = Container()
+    parent["a"] = "old"
+    child = parent.child()
+    child["b"] = "local"
+    child.add_alias("plugins", "a")
+    child.add_alias("plugins", "b")
+
+    assert child[List["plugins"]] == ["old", "local"]  # type: ignore
+
+    parent["a"] = "new"
+
+    assert child[List["plugins"]] == ["new", "local"]  # type: ignore
+    assert child["plugins"] == "new"
+
+    del parent["a"]
+
+    assert child[List["plugins"]] == ["local"]  # type: ignore
+
+
+def test_inject_into_child_container_follows_parent_changes() -> None:
+    parent = Container()
+    child = parent.child()
+
+    @inject(container=child)
+    def greet(name: str = "Tom") -> str:
+        return f"Hello {name}"
+
+    assert greet() == "Hello Tom"
+
+    parent["name"] = "Bob"
+
+    assert greet() == "Hello Bob"
+
+
+def test_child_resolves_async_and_scoped_services_of_parent() -> None:
+    parent = Container()
+
+    async def connect(di: Container) -> Database:
+        return Database("postgres://shared")
+
+    parent.add_async(Database, connect)
+    parent.scoped["request"] = lambda di: object()
+    child = parent.child()
+
+    assert child.is_async(Database)
+    assert asyncio.run(child.resolve_async(Database)) is asyncio.run(parent.resolve_async(Database))
+
+    with child.scope():
+        assert child["request"] is child["request"]
+
+
+def test_parent_does_not_keep_children_alive() -> None:
+    parent = Container()
+    listeners = len(parent._listeners)
+
+    for _ in range(10):
+        parent.child()
+    gc.collect()
+
+    assert len(parent._listeners) == listeners
@@ -325,3 +325,159 @@ def test_delete_service_from_both_services_and_factories():
     del container["edge_case"]
     
     assert "edge_case" not in container
+
+
+def test_generation_moves_on_every_change() -> None:
+    container = Container()
+    generations = [container.generation]
+
+    container["a"] = "value"
+    generations.append(container.generation)
+    container.factories["b"] = lambda di: "value"
+    generations.append(container.generation)
+    container.add_alias("c", "a")
+    generations.append(container.generation)
+    container.clear_cache()
+    generations.append(container.generation)
+    del container["b"]
+    generations.append(container.generation)
+
+    assert generations == sorted(set(generations))
+
+
+def test_generation_does_not_move_on_lookups() -> None:
+    container = Container()
+    container["a"] = lambda di: "value"
+    generation = container.generation
+
+    assert container["a"] == "value"
+    assert "a" in container
+    assert container.generation == generation
+
+
+def test_subscribers_are_notified_about_changes() -> None:
+    container = Container()
+    notifications = []
+
+    def listener(changed: Container) -> None:
+        notifications.append(changed.generation)
+
+    container.subscribe(listener)
+    container["a"] = "value"
+    container.factories["b"] = lambda di: "value"
+
+    container.unsubscribe(listener)
+    container["c"] = "value"
+
+    assert len(notifications) == 2
+    assert notifications[-1] < container.generation
+
+
+def test_get_returns_default_for_missing_service() -> None:
+    container = Container()
+    marker = object()
+
+    assert container.get("missing") is None
+    assert container.get("missing", marker) is marker
+
+
+def test_get_resolves_services_like_getitem() -> None:
+    from typing import Optional
+
+    class A:
+        ...
+
+    class T:
+        ...
+
+    container = Container()
+    container[A] = lambda di: A()
+    container["none"] = None
+    container.factories["factory"] = lambda di: object()
+    container.add_alias(T, A)
+
+    assert container.get(A) is container[A]
+    assert container.get(T) is container[A]
+    assert container.get(Optional[A]) is container[A]
+    assert container.get(List[T]) == [container[A]]
+    assert container.get("none", "default") is None
+    assert container.get("factory") is not container.get("factory")
+
+
+def test_replacing_aliased_service_refreshes_alias_list() -> None:
+    class T:
+        ...
+
+    container = Container()
+    container["a"] = "first a"
+    container["b"] = "b"
+    container.add_alias(T, "a")
+    container.add_alias(T, "b")
+
+    assert container[List[T]] == ["first a", "b"]
+
+    container["a"] = "second a"
+
+    assert container[List[T]] == ["second a", "b"]
+
+    container.factories["b"] = lambda di: "factory b"
+
+    assert container[List[T]] == ["second a", "factory b"]
+
+
+def test_alias_list_of_factory_services_is_created_on_every_lookup() -> None:
+    class T:
+        ...
+
+    container = Container()
+    container["a"] = "a"
+    container.factories["b"] = lambda di: object()
+    container.add_alias(T, "a")
+    container.add_alias(T, "b")
+
+    assert container[List[T]][1] is not container[List[T]][1]
+    assert container.freeze()[List[T]][1] is not container[List[T]][1]
+
+
+def test_adding_alias_refreshes_alias_list() -> None:
+    class T:
+        ...
+
+    container = Container()
+    container["a"] = "a"
+    container["b"] = "b"
+    container.add_alias(T, "a")
+
+    assert container[List[T]] == ["a"]
+
+    container.add_alias(T, "b")
+
+    assert container[List[T]] == ["a", "b"]
+
+
+def test_removing_service_touches_only_its_aliases() -> None:
+    container = Container()
+    for index in range(100):
+        container[f"plugin_{index}"] = index
+        container.add_alias(f"group_{index % 10}", f"plugin_{index}")
+    container.add_alias("all_0", "plugin_0")
+
+    del container["plugin_0"]
+
+    assert list(container._aliases["group_0"]) == [f"plugin_{index}" for index in range(10, 100, 10)]
+    assert "all_0" not in container._aliases
+    assert "plugin_0" not in container._aliased_by
+    assert container._aliased_by["plugin_10"] == {"group_0"}
+
+
+def test_removing_alias_updates_reverse_index() -> None:
+    container = Container()
+    container["a"] = "a"
+    container.add_alias("alias", "a")
+    container.add_alias("other", "a")
+    container["alias"] = "shadowing service"
+
+    del container["alias"]
+
+    assert container._aliased_by["a"] == {"other"}
+    assert container["other"] == "a"
@@ -0,0 +1,57 @@
+import sys
+from typing import List
+
+from kink import Container, inject
+
+
+def test_deferred_inspection_inspects_signature_on_first_call(monkeypatch) -> None:
+    inject_module = sys.modules["kink.inject"]
+    inspected: List[object] = []
+    inspect = inject_module._inspect_function_arguments
+
+    def _inspect(function):
+        inspected.append(function)
+        return inspect(function)
+
+    monkeypatch.setattr(inject_module, "_inspect_function_arguments", _inspect)
+    container = Container()
+    container["name"] = "Bob"
+
+    @inject(container=container, defer_inspection=True)
+    def greet(name: str, greeting: str = "Hello") -> str:
+        return f"{greeting} {name}"
+
+    assert inspected == []
+    assert greet() == "Hello Bob"
+    assert greet("Tom", "Hi") == "Hi Tom"
+    assert greet() == "Hello Bob"
+    assert len(inspected) == 1
+
+
+def test_deferred_inspection_of_constructor() -> None:
+    container = Container()
+    container["name"] = "Bob"
+
+    @inject(container=container, defer_inspection=True)
+    class Greeter:
+        def __init__(self, name: str):
+            self.name = name
+
+    assert container[Greeter].name == "Bob"
+    assert Greeter("Tom").name == "Tom"
+
+
+def test_deferred_inspection_resolves_forward_references_defined_later() -> None:
+    container = Container()
+
+    @inject(container=container, defer_inspection=True)
+    def use(service: "_DefinedLater") -> "_DefinedLater":
+        return service
+
+    container[_DefinedLater] = _DefinedLater()
+
+    assert use() is container[_DefinedLater]
+
+
+class _DefinedLater:
+    ...
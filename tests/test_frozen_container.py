@@ -0,0 +1,129 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from kink import Container, inject
+from kink.errors import FrozenContainerError, ServiceError
+
+
+class Database:
+    ...
+
+
+class IPlugin:
+    ...
+
+
+class PluginA(IPlugin):
+    ...
+
+
+class PluginB(IPlugin):
+    ...
+
+
+def test_freeze_returns_same_container() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+
+    assert not container.frozen
+    assert container.freeze() is container
+    assert container.frozen
+    assert container.freeze() is container
+
+
+def test_frozen_container_resolves_all_kinds_of_keys() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+    container["none"] = None
+    container[Database] = lambda di: Database()
+    container.factories["request_id"] = lambda di: object()
+    container[PluginA] = PluginA()
+    container[PluginB] = lambda di: PluginB()
+    container.add_alias(IPlugin, PluginA)
+    container.add_alias(IPlugin, PluginB)
+    container.freeze()
+
+    assert container["dsn"] == "postgres://"
+    assert container["none"] is None
+    assert container[Database] is container[Database]
+    assert container["request_id"] is not container["request_id"]
+    assert container[IPlugin] is container[PluginA]
+    assert container[Optional[Database]] is container[Database]
+    assert container[List[IPlugin]] == [container[PluginA], container[PluginB]]
+    assert container[List[IPlugin]] is container[List[IPlugin]]
+    assert container.get("missing", "default") == "default"
+    assert Database in container
+    with pytest.raises(ServiceError):
+        container["missing"]
+
+
+def test_frozen_container_resolves_scoped_and_async_services() -> None:
+    container = Container()
+    container.scoped["transaction"] = lambda di: object()
+
+    async def connect(di: Container) -> Database:
+        return Database()
+
+    container.add_async(Database, connect)
+    container.freeze()
+
+    with container.scope():
+        assert container["transaction"] is container["transaction"]
+    assert asyncio.run(container.resolve_async(Database)) is container[Database]
+
+
+def test_frozen_container_cannot_be_modified() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+    container.factories["request_id"] = lambda di: object()
+    container.freeze()
+
+    with pytest.raises(FrozenContainerError):
+        container["dsn"] = "mysql://"
+    with pytest.raises(FrozenContainerError):
+        del container["dsn"]
+    with pytest.raises(FrozenContainerError):
+        container.factories["request_id"] = lambda di: 1
+    with pytest.raises(FrozenContainerError):
+        container.scoped["transaction"] = lambda di: 1
+    with pytest.raises(FrozenContainerError):
+        container.add_alias("database", Database)
+    with pytest.raises(FrozenContainerError):
+        container.clear_cache()
+
+    assert container["dsn"] == "postgres://"
+
+
+def test_services_injected_before_freezing_use_frozen_container() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+    container[PluginA] = PluginA()
+    container[PluginB] = lambda di: PluginB()
+    container.add_alias(IPlugin, PluginA)
+    container.add_alias(IPlugin, PluginB)
+
+    @inject(container=container)
+    def handler(dsn: str, plugins: List[IPlugin]) -> tuple:
+        return dsn, plugins
+
+    container.freeze()
+
+    assert handler() == ("postgres://", [container[PluginA], container[PluginB]])
+
+
+def test_frozen_child_container_resolves_parent_services() -> None:
+    parent = Container()
+    parent["dsn"] = "postgres://"
+    parent[Database] = lambda di: Database()
+    child = parent.child()
+    child["dsn"] = "mysql://"
+    child.freeze()
+
+    assert child["dsn"] == "mysql://"
+    assert child[Database] is parent[Database]
+
+    parent["region"] = "eu"
+
+    assert child["region"] == "eu"
@@ -0,0 +1,125 @@
+import asyncio
+from typing import Any, List, Optional
+
+from kink import Container, inject
+from kink.instrumentation import Instrumentation, ResolutionStats
+
+
+class Database:
+    ...
+
+
+def test_stats_count_hits_misses_and_constructions() -> None:
+    container = Container()
+    container[Database] = lambda di: Database()
+    container.factories["request_id"] = lambda di: 1
+    stats = ResolutionStats()
+    container.instrument(stats)
+
+    container[Database]
+    container[Database]
+    container["request_id"]
+    container["request_id"]
+    container.get("missing")
+
+    assert stats.keys[Database].hits == 2
+    assert stats.keys[Database].constructions == 1
+    assert stats.keys["request_id"].hits == 2
+    assert stats.keys["request_id"].constructions == 2
+    assert stats.keys["missing"].misses == 1
+    assert stats.keys[Database].construction_time > 0
+    assert stats.slowest(1)[0][0] in (Database, "request_id")
+
+
+def test_instrumentation_receives_nested_lookups_in_order() -> None:
+    events: List[Any] = []
+
+    class Recorder(Instrumentation):
+        def before_resolve(self, key: Any) -> None:
+            events.append(("before", key))
+
+        def after_resolve(self, key: Any, found: bool, elapsed: float) -> None:
+            events.append(("after", key, found))
+
+    container = Container()
+    container["dsn"] = "postgres://"
+    container[Database] = lambda di: di["dsn"] and Database()
+    container.instrument(Recorder())
+
+    container[Optional[Database]]
+
+    assert events == [
+        ("before", Optional[Database]),
+        ("before", Database),
+        ("before", "dsn"),
+        ("after", "dsn", True),
+        ("after", Database, True),
+        ("after", Optional[Database], True),
+    ]
+
+
+def test_instrumentation_can_be_turned_off() -> None:
+    container = Container()
+    container["dsn"] = "postgres://"
+    stats = ResolutionStats()
+
+    container.instrument(stats)
+    container["dsn"]
+    container.instrument(None)
+    container["dsn"]
+
+    assert container.instrumentation is None
+    assert stats.keys["dsn"].hits == 1
+    assert "_resolve" not in container.__dict__
+
+
+def test_instrumentation_of_frozen_container() -> None:
+    container = Container()
+    container[Database] = lambda di: Database()
+    container.factories["request_id"] = lambda di: 1
+    stats = ResolutionStats()
+    container.instrument(stats)
+    container.freeze()
+
+    container[Database]
+    container["request_id"]
+
+    assert stats.keys[Database].constructions == 1
+    assert stats.keys["request_id"].constructions == 1
+
+    container.instrument(None)
+
+    assert container["request_id"] == 1
+    assert stats.keys["request_id"].hits == 1
+
+
+def test_stats_of_injected_calls() -> None:
+    container = Container()
+    container[Database] = lambda di: Database()
+    stats = ResolutionStats()
+    container.instrument(stats)
+
+    @inject(container=container)
+    def handler(db: Database) -> Database:
+        return db
+
+    handler()
+    handler()
+    handler(Database())
+
+    assert stats.injections[handler.__wrapped__].calls == 2
+
+
+def test_stats_of_async_constructions() -> None:
+    container = Container()
+
+    async def connect(di: Container) -> Database:
+        return Database()
+
+    container.add_async(Database, connect)
+    stats = ResolutionStats()
+    container.instrument(stats)
+
+    asyncio.run(container.resolve_async(Database))
+
+    assert stats.keys[Database].constructions == 1
@@ -0,0 +1,156 @@
+from typing import List
+
+import pytest
+
+from kink import Container, LRUPolicy, inject
+from kink.errors import FrozenContainerError
+
+
+class Secret:
+    pass
+
+
+class Unrelated:
+    pass
+
+
+class Handler:
+    pass
+
+
+def test_invalidate_drops_only_given_service() -> None:
+    container = Container()
+    container[Secret] = lambda di: Secret()
+    container[Unrelated] = lambda di: Unrelated()
+
+    @inject(container=container)
+    class Client:
+        def __init__(self, secret: Secret):
+            self.secret = secret
+
+    secret, client, unrelated = container[Secret], container[Client], container[Unrelated]
+
+    assert container.invalidate(Secret) == [Secret]
+
+    assert container[Secret] is not secret
+    assert container[Client] is client
+    assert container[Unrelated] is unrelated
+
+
+def test_invalidate_cascades_to_dependents() -> None:
+    container = Container()
+    container[Secret] = lambda di: Secret()
+    container[Unrelated] = lambda di: Unrelated()
+
+    @inject(container=container)
+    class Client:
+        def __init__(self, secret: Secret):
+            self.secret = secret
+
+    @inject(container=container, use_factory=True)
+    class Session:
+        def __init__(self, client: Client):
+            self.client = client
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, session: Session):
+            self.session = session
+
+    repository, unrelated = container[Repository], container[Unrelated]
+
+    assert set(container.invalidate(Secret, cascade=True)) == {Secret, Client, Repository}
+
+    assert container[Repository] is not repository
+    assert container[Repository].session.client.secret is container[Secret]
+    assert container[Unrelated] is unrelated
+
+
+def test_invalidate_by_alias() -> None:
+    container = Container()
+    container["a"] = lambda di: Handler()
+    container["b"] = lambda di: Handler()
+    container["c"] = lambda di: Handler()
+    container.add_alias(Handler, "a")
+    container.add_alias(Handler, "b")
+    a, b, c = container["a"], container["b"], container["c"]
+    handlers = container[List[Handler]]
+
+    assert container.invalidate(Handler) == ["a", "b"]
+
+    assert container["a"] is not a and container["b"] is not b
+    assert container["c"] is c
+    assert container[List[Handler]] is not handlers
+
+
+def test_invalidate_by_predicate() -> None:
+    container = Container()
+    for tenant in ["acme", "globex"]:
+        container[f"client:{tenant}"] = lambda di: object()
+    container["config"] = lambda di: object()
+    config = container["config"]
+    container["client:acme"]
+
+    assert container.invalidate(where=lambda key: str(key).startswith("client:")) == ["client:acme"]
+    assert container["config"] is config
+
+
+def test_invalidate_service_held_by_cache_policy() -> None:
+    container = Container()
+    container["client"] = lambda di: object()
+    policy = LRUPolicy(max_size=2)
+    container.set_cache_policy("client", policy)
+    container["client"]
+
+    assert container.invalidate("client") == ["client"]
+    assert len(policy) == 0
+
+
+def test_invalidate_parent_service_from_child() -> None:
+    container = Container()
+    container["service"] = lambda di: object()
+    child = container.child()
+    service = child["service"]
+
+    assert child.invalidate("service") == ["service"]
+    assert container["service"] is not service
+
+
+def test_invalidate_notifies_subscribers() -> None:
+    container = Container()
+    container[Secret] = lambda di: Secret()
+    child = container.child()
+    notified: List[Container] = []
+    container.subscribe(notified.append)
+    child.subscribe(notified.append)
+    generation = child.generation
+
+    assert container.invalidate(Secret) == []
+    assert notified == []
+
+    secret = child[Secret]
+    assert child.invalidate(Secret) == [Secret]
+
+    assert len(notified) == 2 and set(notified) == {container, child}
+    assert child.generation > generation
+    assert child[Secret] is not secret
+
+
+def test_invalidate_frozen_container() -> None:
+    container = Container()
+    container[Secret] = lambda di: Secret()
+
+    @inject(container=container)
+    class Client:
+        def __init__(self, secret: Secret):
+            self.secret = secret
+
+    container.freeze()
+    client = container[Client]
+
+    assert set(container.invalidate(Secret, cascade=True)) == {Secret, Client}
+
+    assert container[Client] is not client
+    assert container[Client].secret is container[Secret] is not client.secret
+    with pytest.raises(FrozenContainerError):
+        container[Secret] = Secret()
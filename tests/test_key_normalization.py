@@ -0,0 +1,127 @@
+import sys
+from typing import List, Optional, Sequence, Union
+
+import pytest
+from typing_extensions import Annotated
+
+from kink import Container, inject
+from kink.typing_support import KEY_ANNOTATED, KEY_OPTIONAL, KEY_PLAIN, KEY_SEQUENCE, normalize_key
+
+
+class Database:
+    pass
+
+
+class IPlugin:
+    pass
+
+
+class PluginA(IPlugin):
+    pass
+
+
+class PluginB(IPlugin):
+    pass
+
+
+def test_normalize_key() -> None:
+    assert normalize_key("name") == ("name", KEY_PLAIN)
+    assert normalize_key(Database) == (Database, KEY_PLAIN)
+    assert normalize_key(Optional[Database]) == (Database, KEY_OPTIONAL)
+    assert normalize_key(Union[Database, int, None]) == (Database, KEY_OPTIONAL)
+    assert normalize_key(Annotated[Database, "primary"]) == (Database, KEY_ANNOTATED)
+    assert normalize_key(Annotated[Optional[Database], "primary"]) == (Database, KEY_OPTIONAL)
+    assert normalize_key(List[IPlugin]) == (IPlugin, KEY_SEQUENCE)
+    assert normalize_key(Sequence[IPlugin]) == (IPlugin, KEY_SEQUENCE)
+    assert normalize_key(List["plugins"]) == ("plugins", KEY_SEQUENCE)  # type: ignore
+
+
+def test_normalized_typing_keys_are_cached(monkeypatch) -> None:
+    typing_support = sys.modules["kink.typing_support"]
+    normalized: List[object] = []
+    normalize = typing_support._normalize
+
+    def _normalize(key):
+        normalized.append(key)
+        return normalize(key)
+
+    monkeypatch.setattr(typing_support, "_normalize", _normalize)
+    key = Optional[Annotated[PluginA, "cached"]]
+
+    assert normalize_key(key) == (PluginA, KEY_OPTIONAL)
+    calls = len(normalized)
+    assert normalize_key(key) == (PluginA, KEY_OPTIONAL)
+    assert len(normalized) == calls
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions require python 3.10")
+def test_pep_604_optional_keys() -> None:
+    container = Container()
+    container[Database] = Database()
+    key = eval("Database | None")
+
+    assert normalize_key(key) == (Database, KEY_OPTIONAL)
+    assert normalize_key(eval("None | Database")) == (Database, KEY_OPTIONAL)
+    assert key in container
+    assert container[key] is container[Database]
+
+    @inject(container=container)
+    def use(database: key) -> Database:  # type: ignore
+        return database
+
+    assert use() is container[Database]
+
+
+def test_annotated_keys_resolve_the_annotated_service() -> None:
+    container = Container()
+    container[Database] = Database()
+
+    assert Annotated[Database, "primary"] in container
+    assert container[Annotated[Database, "primary"]] is container[Database]
+
+
+def test_sequence_of_aliased_services() -> None:
+    container = Container()
+    container[PluginA] = PluginA()
+    container.add_alias(IPlugin, PluginA)
+
+    assert Sequence[IPlugin] in container
+    assert container[Sequence[IPlugin]] == [container[PluginA]]
+
+    container[PluginB] = PluginB()
+    container.add_alias(IPlugin, PluginB)
+
+    # every memoized variant of the list is dropped when an alias is added
+    assert container[Sequence[IPlugin]] == [container[PluginA], container[PluginB]]
+    assert container[List[IPlugin]] == [container[PluginA], container[PluginB]]
+
+
+def test_list_of_string_alias() -> None:
+    container = Container()
+    container["first"] = 1
+    container["second"] = 2
+    container.add_alias("numbers", "first")
+    container.add_alias("numbers", "second")
+
+    assert container[List["numbers"]] == [1, 2]  # type: ignore
+
+    del container["second"]
+
+    assert container[List["numbers"]] == [1]  # type: ignore
+
+
+def test_typing_key_registered_after_lookup() -> None:
+    container = Container()
+    container[Database] = Database()
+    key = Optional[Database]
+
+    assert container[key] is container[Database]
+    assert key in container
+
+    container[key] = "exact"
+
+    assert container[key] == "exact"
+
+    del container[key]
+
+    assert container[key] is container[Database]
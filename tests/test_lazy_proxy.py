@@ -0,0 +1,107 @@
+from typing import List
+
+import pytest
+
+from kink import Container, Lazy, LazyProxy, inject, resolve_lazy
+from kink.errors import ServiceError
+
+
+class SearchClient:
+    def __init__(self, log: List[str]):
+        log.append("created")
+        self.host = "localhost"
+
+    def query(self, phrase: str) -> str:
+        return f"results for {phrase}"
+
+
+def test_lazy_dependency_is_resolved_on_first_use() -> None:
+    container = Container()
+    container["log"] = []
+    container[SearchClient] = lambda di: SearchClient(di["log"])
+
+    @inject(container=container)
+    def search(phrase: str, client: Lazy[SearchClient]) -> str:
+        assert container["log"] == []
+        return client.query(phrase)
+
+    assert search("kink") == "results for kink"
+    assert container["log"] == ["created"]
+
+
+def test_unused_lazy_dependency_is_never_created() -> None:
+    container = Container()
+    container["log"] = []
+    container[SearchClient] = lambda di: SearchClient(di["log"])
+
+    @inject(container=container)
+    class Handler:
+        def __init__(self, client: Lazy[SearchClient]):
+            self.client = client
+
+    handler = container[Handler]
+
+    assert isinstance(handler.client, LazyProxy)
+    assert container["log"] == []
+    assert resolve_lazy(handler.client) is container[SearchClient]
+    assert container["log"] == ["created"]
+
+
+def test_lazy_proxy_caches_resolved_service() -> None:
+    container = Container()
+    container["log"] = []
+    container.factories[SearchClient] = lambda di: SearchClient(di["log"])
+    proxy = LazyProxy(container, SearchClient)
+
+    assert repr(proxy) == "<LazyProxy SearchClient>"
+    assert proxy.host == "localhost"
+    proxy.host = "example.com"
+
+    assert proxy.host == "example.com"
+    assert container["log"] == ["created"]
+
+
+def test_lazy_parameter_resolved_by_name() -> None:
+    container = Container()
+    container["numbers"] = lambda di: [1, 2, 3]
+
+    @inject(container=container)
+    def total(numbers: Lazy[List[int]]) -> int:
+        return sum(numbers) + len(numbers)
+
+    assert total() == 9
+
+
+def test_passed_argument_takes_precedence_over_lazy_dependency() -> None:
+    container = Container()
+    container["log"] = []
+    container[SearchClient] = lambda di: SearchClient(di["log"])
+
+    @inject(container=container)
+    def search(client: Lazy[SearchClient]) -> object:
+        return client
+
+    assert search("passed") == "passed"
+    assert isinstance(search(), LazyProxy)
+
+
+def test_lazy_dependency_is_not_a_construction_dependency() -> None:
+    container = Container()
+    container["log"] = []
+    container[SearchClient] = lambda di: SearchClient(di["log"])
+
+    @inject(container=container)
+    class Handler:
+        def __init__(self, client: Lazy[SearchClient]):
+            self.client = client
+
+    assert Handler.__init__.__injection__.dependencies() == {}
+    assert Handler.__init__.__injection__.unresolved() == ()
+
+
+def test_missing_lazy_dependency_fails_on_use() -> None:
+    container = Container()
+    proxy = LazyProxy(container, SearchClient)
+
+    with pytest.raises(ServiceError):
+        proxy.query("kink")
@@ -0,0 +1,185 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from typing import List
+
+import pytest
+
+from kink import Container, inject
+from kink.errors import ResolverError
+
+
+class Engine:
+    pass
+
+
+class Session:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+
+def _managed(events: List[str], name: str, service: object):
+    @contextmanager
+    def _manager(di):
+        events.append(f"enter {name}")
+        yield service
+        events.append(f"exit {name}")
+
+    return _manager
+
+
+def _managed_async(events: List[str], name: str, service: object, delay: float = 0):
+    @asynccontextmanager
+    async def _manager(di):
+        events.append(f"enter {name}")
+        yield service
+        await asyncio.sleep(delay)
+        events.append(f"exit {name}")
+
+    return _manager
+
+
+def test_close_exits_services_in_reverse_dependency_order() -> None:
+    container = Container()
+    events: List[str] = []
+    container.add_managed(Engine, _managed(events, "engine", Engine()))
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, session: Session):
+            self.session = session
+
+    container.add_managed(Session, lambda di: _managed(events, "session", Session(di[Engine]))(di))
+    container[Repository]
+    assert container[Engine] is container[Session].engine
+
+    container.close()
+
+    assert events == ["enter engine", "enter session", "exit session", "exit engine"]
+
+
+def test_dependencies_known_from_inject_are_closed_after_dependents() -> None:
+    container = Container()
+    events: List[str] = []
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, session: Session):
+            self.session = session
+
+    container.add_managed_async(Session, _managed_async(events, "session", Session(Engine())))
+    container.add_managed_async(Repository, _managed_async(events, "repository", object(), delay=0.01))
+
+    async def _main() -> None:
+        # session is created on its own, the repository only finds it memoized
+        await container.resolve_async(Session)
+        await container.resolve_async(Repository)
+        await container.aclose()
+
+    asyncio.run(_main())
+
+    assert events[-2:] == ["exit repository", "exit session"]
+
+
+def test_closed_services_are_created_again() -> None:
+    container = Container()
+    events: List[str] = []
+    container.add_managed(Engine, lambda di: _managed(events, "engine", Engine())(di))
+    engine = container[Engine]
+
+    container.close()
+
+    assert container[Engine] is not engine
+    assert events == ["enter engine", "exit engine", "enter engine"]
+
+
+def test_close_exits_all_services_before_raising() -> None:
+    container = Container()
+    events: List[str] = []
+
+    @contextmanager
+    def _failing(di):
+        yield object()
+        raise RuntimeError("cannot close")
+
+    container.add_managed("failing", _failing)
+    container.add_managed(Engine, _managed(events, "engine", Engine()))
+    container[Engine]
+    container["failing"]
+
+    with pytest.raises(RuntimeError):
+        container.close()
+
+    assert events == ["enter engine", "exit engine"]
+
+
+def test_close_requires_aclose_for_asynchronous_services() -> None:
+    container = Container()
+    container.add_managed_async(Engine, _managed_async([], "engine", Engine()))
+    asyncio.run(container.resolve_async(Engine))
+
+    with pytest.raises(ResolverError):
+        container.close()
+
+
+def test_aclose_exits_independent_services_concurrently() -> None:
+    container = Container()
+    events: List[str] = []
+    container.add_managed_async("first", _managed_async(events, "first", object(), delay=0.01))
+    container.add_managed_async("second", _managed_async(events, "second", object(), delay=0.01))
+
+    @asynccontextmanager
+    async def _dependent(di):
+        await di.resolve_async("first")
+        events.append("enter dependent")
+        yield object()
+        events.append("exit dependent")
+
+    container.add_managed_async("dependent", _dependent)
+
+    async def _main() -> None:
+        await container.resolve_async("second")
+        await container.resolve_async("dependent")
+        await container.aclose()
+
+    asyncio.run(_main())
+
+    # second is closed together with dependent, first only once dependent was closed
+    assert events[-3:] == ["exit dependent", "exit second", "exit first"]
+
+
+def test_closed_services_of_frozen_container_are_created_again() -> None:
+    container = Container()
+    events: List[str] = []
+    container.add_managed(Engine, lambda di: _managed(events, "engine", Engine())(di))
+    container.add_alias("engines", Engine)
+    container.freeze()
+    engine = container[Engine]
+    assert container[List["engines"]] == [engine]  # type: ignore
+
+    container.close()
+
+    assert container[Engine] is not engine
+    assert container[List["engines"]] == [container[Engine]]  # type: ignore
+    assert events == ["enter engine", "exit engine", "enter engine"]
+
+
+def test_services_holding_closed_services_are_created_again() -> None:
+    container = Container()
+    container.add_managed(Engine, lambda di: _managed([], "engine", Engine())(di))
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, engine: Engine):
+            self.engine = engine
+
+    repository = container[Repository]
+    notified: List[Container] = []
+    container.subscribe(notified.append)
+    generation = container.generation
+
+    container.close()
+
+    assert container[Repository] is not repository
+    assert container[Repository].engine is container[Engine] is not repository.engine
+    assert notified == [container]
+    assert container.generation > generation
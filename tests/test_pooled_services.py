@@ -0,0 +1,230 @@
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from kink import Container, Pool, inject
+from kink.errors import PoolTimeoutError, ResolverError
+
+
+class Connection:
+    def __init__(self, number: int):
+        self.number = number
+
+
+def test_injected_call_checks_pooled_instance_out_and_returns_it() -> None:
+    container = Container()
+    created: List[Connection] = []
+    container.add_pooled(Connection, lambda di: created.append(Connection(len(created))) or created[-1], max_size=2)
+
+    @inject(container=container)
+    def query(connection: Connection) -> Connection:
+        assert container.pool(Connection).in_use == 1
+        return connection
+
+    first = query()
+    assert query() is first
+    assert container.pool(Connection).in_use == 0
+    assert container.pool(Connection).stats.acquisitions == 2
+    assert created == [first]
+
+
+def test_instance_is_returned_when_call_fails() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=2)
+
+    @inject(container=container)
+    def query(connection: Connection) -> None:
+        raise RuntimeError("query failed")
+
+    with pytest.raises(RuntimeError):
+        query()
+
+    assert container.pool(Connection).in_use == 0
+
+
+def test_concurrent_calls_use_separate_instances_up_to_pool_size() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=2)
+    barrier = threading.Barrier(2)
+    used: List[Connection] = []
+
+    @inject(container=container)
+    def query(connection: Connection) -> None:
+        used.append(connection)
+        barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=query) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(connection) for connection in used}) == 2
+    assert container.pool(Connection).size == 2
+
+
+def test_acquire_waits_for_released_instance() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=1)
+    pool = container.pool(Connection)
+    connection = pool.acquire()
+    acquired: List[Connection] = []
+
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+    while not pool.stats.waits:
+        pass
+    pool.release(connection)
+    thread.join()
+
+    assert acquired == [connection]
+    assert pool.stats.waits == 1
+    assert pool.stats.max_wait_time > 0
+
+
+def test_acquire_times_out() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=1, timeout=0.01)
+    pool = container.pool(Connection)
+
+    with pool.checkout():
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+
+    assert pool.stats.timeouts == 1
+
+
+def test_failed_construction_frees_pool_slot() -> None:
+    attempts: List[int] = []
+
+    def _factory() -> object:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("cannot connect")
+        return object()
+
+    pool = Pool(_factory, max_size=1)
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+
+    with pool.checkout() as instance:
+        assert instance is not None
+    assert pool.size == 1
+
+
+def test_pooled_service_cannot_be_resolved_directly() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=2)
+
+    assert Connection in container
+    with pytest.raises(ResolverError):
+        container[Connection]
+
+
+def test_async_injected_call_uses_pooled_instance() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=1)
+
+    @inject(container=container)
+    async def query(connection: Connection) -> int:
+        await asyncio.sleep(0)
+        return connection.number
+
+    async def _main() -> List[int]:
+        return list(await asyncio.gather(query(), query(), query()))
+
+    assert asyncio.run(_main()) == [0, 0, 0]
+    assert container.pool(Connection).in_use == 0
+    assert container.pool(Connection).size == 1
+
+
+def test_replacing_pooled_service() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=2)
+    container[Connection] = Connection(42)
+
+    @inject(container=container)
+    def query(connection: Connection) -> int:
+        return connection.number
+
+    assert query() == 42
+
+
+def test_async_waiters_do_not_occupy_threads() -> None:
+    pool = Pool(object, max_size=1)
+    held = pool.acquire()
+    used: List[object] = []
+
+    async def _use() -> None:
+        instance = await pool.acquire_async()
+        used.append(instance)
+        await asyncio.sleep(0)
+        pool.release(instance)
+
+    async def _main() -> None:
+        threads = threading.active_count()
+        tasks = [asyncio.ensure_future(_use()) for _ in range(50)]
+        while pool.stats.waits < 50:
+            await asyncio.sleep(0)
+
+        assert threading.active_count() == threads
+        # instances released by other threads wake the waiters as well
+        await asyncio.get_running_loop().run_in_executor(None, pool.release, held)
+        await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+    asyncio.run(_main())
+
+    assert used == [held] * 50
+    assert pool.in_use == 0
+
+
+def test_cancelled_async_waiter_passes_instance_on() -> None:
+    pool = Pool(object, max_size=1)
+    held = pool.acquire()
+
+    async def _main() -> object:
+        cancelled = asyncio.ensure_future(pool.acquire_async())
+        waiting = asyncio.ensure_future(pool.acquire_async())
+        while pool.stats.waits < 2:
+            await asyncio.sleep(0)
+
+        pool.release(held)
+        cancelled.cancel()
+
+        return await asyncio.wait_for(waiting, 5)
+
+    assert asyncio.run(_main()) is held
+    assert pool.in_use == 1
+
+
+def test_async_acquire_times_out() -> None:
+    pool = Pool(object, max_size=1, timeout=0.01)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        asyncio.run(pool.acquire_async())
+
+    assert pool.stats.timeouts == 1
+    assert pool.stats.waits == 1
+
+
+def test_pooled_service_cannot_be_injected_into_constructor() -> None:
+    container = Container()
+    container.add_pooled(Connection, lambda di: Connection(0), max_size=1)
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection):
+            self.connection = connection
+
+    with pytest.raises(ResolverError) as error:
+        container[Repository]
+
+    assert "constructor" in str(error.value)
+    assert container.pool(Connection).in_use == 0
+    with pytest.raises(ResolverError) as error:
+        container.validate()
+    assert "Cannot inject pooled services into parameters `connection`" in str(error.value)
+    assert container.validate(strict=False).pooled == {Repository: ("connection",)}
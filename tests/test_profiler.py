@@ -0,0 +1,88 @@
+import json
+import time
+
+from kink import Container, inject
+from kink.profiler import ResolutionProfiler
+
+
+class C:
+    def __init__(self) -> None:
+        time.sleep(0.01)
+
+
+def test_profiler_records_dependency_tree() -> None:
+    container = Container()
+    container[C] = lambda di: C()
+
+    @inject(container=container)
+    class B:
+        def __init__(self, c: C):
+            self.c = c
+
+    @inject(container=container)
+    class A:
+        def __init__(self, b: B):
+            self.b = b
+
+    profiler = ResolutionProfiler()
+    container.instrument(profiler)
+
+    container[A]
+
+    a_node = profiler.root.children[A]
+    (b_node,) = a_node.children.values()
+    (c_node,) = b_node.children.values()
+
+    assert b_node.key is B
+    assert c_node.key is C
+    assert a_node.constructions == b_node.constructions == c_node.constructions == 1
+    assert c_node.self_time >= 0.01
+    assert b_node.total_time >= c_node.total_time
+    assert b_node.self_time < c_node.self_time
+    assert a_node.total_time >= b_node.total_time
+
+
+def test_profiler_exports_folded_stacks_and_json() -> None:
+    container = Container()
+    container[C] = lambda di: C()
+
+    @inject(container=container)
+    class B:
+        def __init__(self, c: C):
+            self.c = c
+
+    @inject(container=container)
+    class A:
+        def __init__(self, b: B):
+            self.b = b
+
+    profiler = ResolutionProfiler()
+    container.instrument(profiler)
+
+    container[A]
+
+    folded = profiler.folded().splitlines()
+    assert f"{A.__qualname__};{B.__qualname__};C" in [line.rsplit(" ", 1)[0] for line in folded]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in folded)
+
+    (a_tree,) = json.loads(profiler.to_json())
+    assert a_tree["key"] == A.__qualname__
+    assert a_tree["children"][0]["key"] == B.__qualname__
+    assert a_tree["children"][0]["children"][0]["key"] == "C"
+
+
+def test_profiler_merges_repeated_resolutions() -> None:
+    container = Container()
+    container.factories["request_id"] = lambda di: 1
+    profiler = ResolutionProfiler()
+    container.instrument(profiler)
+
+    for _ in range(3):
+        container["request_id"]
+
+    assert profiler.root.children["request_id"].calls == 3
+    assert profiler.root.children["request_id"].constructions == 3
+
+    profiler.reset()
+
+    assert profiler.root.children == {}
@@ -0,0 +1,162 @@
+import pytest
+
+from kink import Container, inject
+from kink.errors import ExecutionError
+
+
+def test_plan_picks_up_services_registered_after_first_call() -> None:
+    container = Container()
+
+    @inject(container=container)
+    def greet(name: str = "Tom") -> str:
+        return f"Hello {name}"
+
+    assert greet() == "Hello Tom"
+
+    container["name"] = "Bob"
+
+    assert greet() == "Hello Bob"
+
+
+def test_plan_picks_up_factories_registered_after_first_call() -> None:
+    class Counter:
+        ...
+
+    container = Container()
+
+    @inject(container=container)
+    def use_counter(counter: Counter = None) -> Counter:
+        return counter
+
+    assert use_counter() is None
+
+    container.factories[Counter] = lambda di: Counter()
+
+    assert isinstance(use_counter(), Counter)
+    assert use_counter() is not use_counter()
+
+
+def test_plan_follows_removed_services() -> None:
+    container = Container()
+    container["name"] = "Bob"
+
+    @inject(container=container)
+    def greet(name: str = "Tom") -> str:
+        return f"Hello {name}"
+
+    assert greet() == "Hello Bob"
+
+    del container["name"]
+
+    assert greet() == "Hello Tom"
+
+
+def test_plan_does_not_resolve_passed_arguments() -> None:
+    container = Container()
+    calls = []
+    container.factories["a"] = lambda di: calls.append("a") or "resolved a"
+    container["b"] = "resolved b"
+
+    @inject(container=container)
+    def use(a: str, b: str) -> str:
+        return a + b
+
+    assert use(b="x") == "resolved ax"
+    assert use("y") == "yresolved b"
+    assert calls == ["a"]
+
+
+def test_missing_arguments_are_passed_positionally() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    container["greeting"] = "Hi"
+
+    @inject(container=container)
+    def greet(name, /, greeting: str, *, punctuation: str = "!") -> str:
+        return f"{greeting} {name}{punctuation}"
+
+    assert greet() == "Hi Bob!"
+    assert greet("Tom") == "Hi Tom!"
+    assert greet("Tom", "Hello") == "Hello Tom!"
+    assert greet(greeting="Hey") == "Hey Bob!"
+
+
+def test_positional_call_falls_back_for_unresolved_arguments() -> None:
+    container = Container()
+
+    @inject(container=container)
+    def greet(name: str, greeting: str = "Hello") -> str:
+        return f"{greeting} {name}"
+
+    assert greet("Tom") == "Hello Tom"
+    with pytest.raises(ExecutionError):
+        greet()
+
+
+def test_variadic_functions_are_not_called_positionally() -> None:
+    container = Container()
+    container["name"] = "Bob"
+
+    @inject(container=container)
+    def greet(name: str, *names: str) -> str:
+        return ", ".join([name, *names])
+
+    assert greet("Tom", "Ann") == "Tom, Ann"
+    assert greet.__injection__._plan().call is None
+
+
+def test_plan_is_kept_when_services_are_replaced() -> None:
+    container = Container()
+    container["request"] = 1
+
+    @inject(container=container)
+    def handle(request: int) -> int:
+        return request
+
+    assert handle() == 1
+    plan = handle.__injection__._plan()
+
+    container["request"] = 2
+    container.clear_cache()
+
+    assert handle() == 2
+    assert handle.__injection__._plan() is plan
+
+    container["other"] = 3
+
+    assert handle.__injection__._plan() is not plan
+
+
+def test_child_plan_follows_keys_registered_in_parent() -> None:
+    container = Container()
+    child = container.child()
+
+    @inject(container=child)
+    def greet(name: str = "Tom") -> str:
+        return f"Hello {name}"
+
+    assert greet() == "Hello Tom"
+
+    container["name"] = "Bob"
+    assert greet() == "Hello Bob"
+
+    container["name"] = "Ann"
+    assert greet() == "Hello Ann"
+
+
+def test_recompiled_plan_reuses_generated_call() -> None:
+    container = Container()
+    container["request"] = 1
+
+    @inject(container=container)
+    def handle(request: int) -> int:
+        return request
+
+    assert handle() == 1
+    plan = handle.__injection__._plan()
+
+    container["other"] = 2
+
+    assert handle() == 1
+    assert handle.__injection__._plan() is not plan
+    assert handle.__injection__._plan().call.__code__ is plan.call.__code__
@@ -0,0 +1,173 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import pytest
+
+from kink import Container
+from kink.container import _RESOLVE_MANY_ATTEMPTS
+from kink.errors import MissingServicesError, ServiceError
+
+
+class Database:
+    pass
+
+
+def test_resolve_many_returns_services_in_order() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    container[Database] = lambda di: Database()
+    container.factories["request_id"] = lambda di: 1
+    container.add_alias("db", Database)
+
+    name, database, request_id, aliased, optional = container.resolve_many(
+        ["name", Database, "request_id", "db", Optional[Database]]
+    )
+
+    assert (name, request_id) == ("Bob", 1)
+    assert database is aliased is optional is container[Database]
+
+
+def test_resolve_many_raises_on_first_missing_key() -> None:
+    container = Container()
+    container["name"] = "Bob"
+
+    with pytest.raises(ServiceError) as error:
+        container.resolve_many(["name", "missing", "other"])
+
+    assert not isinstance(error.value, MissingServicesError)
+    assert "missing" in str(error.value)
+
+
+def test_resolve_many_reports_all_missing_keys() -> None:
+    container = Container()
+    container["name"] = "Bob"
+
+    with pytest.raises(MissingServicesError) as error:
+        container.resolve_many(["missing", "name", "other"], report_all_missing=True)
+
+    assert error.value.keys == ["missing", "other"]
+
+
+def test_resolve_many_in_child_container() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    container.factories["request_id"] = lambda di: 1
+    child = container.child()
+    child["name"] = "Tom"
+
+    assert child.resolve_many(["name", "request_id"]) == ("Tom", 1)
+
+
+def test_batch_is_resolved_again_after_concurrent_change() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    started, release = threading.Event(), threading.Event()
+    container.factories["slow"] = lambda di: started.set() or release.wait(5) and "slow"
+    results: List[Tuple] = []
+
+    batch = threading.Thread(target=lambda: results.append(container.resolve_many(["name", "slow"])))
+    batch.start()
+    assert started.wait(5)
+    change = threading.Thread(target=container.__setitem__, args=("name", "Tom"))
+    change.start()
+    change.join(5)
+
+    assert not change.is_alive()
+    release.set()
+    batch.join(5)
+    assert results == [("Tom", "slow")]
+
+
+def test_batch_does_not_deadlock_with_constructing_thread() -> None:
+    container = Container()
+    constructing, batch_started = threading.Event(), threading.Event()
+
+    def create_slow(di: Container) -> str:
+        constructing.set()
+        batch_started.wait(5)
+        # the service being constructed is awaited by the batch while its factory changes the container
+        di["registered_by_slow"] = True
+        return "slow"
+
+    container["slow"] = lambda di: create_slow(di)
+    results: List[Tuple] = []
+
+    construction = threading.Thread(target=container.__getitem__, args=("slow",), daemon=True)
+    construction.start()
+    assert constructing.wait(5)
+    batch = threading.Thread(target=lambda: results.append(container.resolve_many(["slow"])), daemon=True)
+    batch.start()
+    batch.join(0.05)
+    batch_started.set()
+    construction.join(5)
+    batch.join(5)
+
+    assert not construction.is_alive() and not batch.is_alive()
+    assert results == [("slow",)]
+
+
+def test_batch_is_not_resolved_again_after_unrelated_changes() -> None:
+    container = Container()
+    container["a"] = "a"
+    container["request_id"] = 0
+    calls: List[int] = []
+
+    def create_slow(di: Container) -> str:
+        calls.append(1)
+        # a per request value written by another thread while the batch is resolved
+        di["request_id"] = len(calls)
+        return "slow"
+
+    container.factories["slow"] = lambda di: create_slow(di)
+
+    assert container.resolve_many(["a", "slow"]) == ("a", "slow")
+    assert calls == [1]
+
+
+def test_batch_is_not_resolved_again_with_concurrent_writer() -> None:
+    container = Container()
+    container["a"] = "a"
+    container.factories["slow"] = lambda di: time.sleep(0.001) or "slow"
+    stop = threading.Event()
+
+    def write() -> None:
+        request_id = 0
+        while not stop.is_set():
+            request_id += 1
+            container["request_id"] = request_id
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    try:
+        results = [container.resolve_many(["a", "slow"]) for _ in range(50)]
+    finally:
+        stop.set()
+        writer.join(5)
+
+    assert results == [("a", "slow")] * 50
+
+
+def test_last_attempt_holds_off_changes_of_batch_services() -> None:
+    container = Container()
+    container["counter"] = 0
+    calls: List[int] = []
+
+    def create_restless(di: Container) -> str:
+        calls.append(1)
+        di["counter"] = len(calls)
+        return "restless"
+
+    container.factories["restless"] = lambda di: create_restless(di)
+
+    assert container.resolve_many(["counter", "restless"]) == (len(calls) - 1, "restless")
+    assert len(calls) == _RESOLVE_MANY_ATTEMPTS + 1
+
+
+def test_resolve_many_in_frozen_container() -> None:
+    container = Container()
+    container["name"] = "Bob"
+    container.factories["request_id"] = lambda di: 1
+    container.freeze()
+
+    assert container.resolve_many(["name", "request_id"]) == ("Bob", 1)
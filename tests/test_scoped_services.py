@@ -0,0 +1,106 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from kink import Container, inject
+from kink.errors import ResolverError
+
+
+class Transaction:
+    ...
+
+
+def test_scoped_service_is_created_once_per_scope() -> None:
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+
+    with container.scope():
+        first = container[Transaction]
+        assert container[Transaction] is first
+
+    with container.scope():
+        second = container[Transaction]
+        assert container[Transaction] is second
+
+    assert first is not second
+
+
+def test_scoped_service_cannot_be_resolved_outside_of_scope() -> None:
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+
+    assert Transaction in container
+    with pytest.raises(ResolverError):
+        container[Transaction]
+
+
+def test_alias_list_of_scoped_services_is_bound_to_scope() -> None:
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+    container.add_alias("transactions", Transaction)
+
+    with container.scope():
+        first = container[List["transactions"]][0]  # type: ignore
+        assert container[List["transactions"]][0] is first  # type: ignore
+
+    with container.scope():
+        assert container[List["transactions"]][0] is not first  # type: ignore
+
+    with pytest.raises(ResolverError):
+        container[List["transactions"]]  # type: ignore
+
+
+def test_scoped_service_is_shared_by_injected_callables() -> None:
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, transaction: Transaction):
+            self.transaction = transaction
+
+    container.factories[Repository] = lambda di: Repository()
+
+    @inject(container=container)
+    def handler(repository: Repository, transaction: Transaction) -> bool:
+        return repository.transaction is transaction
+
+    with container.scope():
+        assert handler()
+
+
+def test_scoped_service_can_be_aliased() -> None:
+    class ITransaction:
+        ...
+
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+    container.add_alias(ITransaction, Transaction)
+
+    with container.scope():
+        assert container[ITransaction] is container[Transaction]
+
+
+def test_scopes_are_isolated_between_tasks() -> None:
+    container = Container()
+    container.scoped[Transaction] = lambda di: Transaction()
+
+    async def request() -> tuple:
+        with container.scope():
+            transaction = container[Transaction]
+            await asyncio.sleep(0.01)
+            shared = await asyncio.gather(asyncio.ensure_future(_in_task()), asyncio.ensure_future(_in_task()))
+            return transaction, shared
+
+    async def _in_task() -> Transaction:
+        return container[Transaction]
+
+    async def _run() -> list:
+        return await asyncio.gather(request(), request())
+
+    (first, first_shared), (second, second_shared) = asyncio.run(_run())
+
+    assert first is not second
+    assert all(transaction is first for transaction in first_shared)
+    assert all(transaction is second for transaction in second_shared)
@@ -0,0 +1,63 @@
+import time
+from threading import Barrier, Thread
+from typing import List
+
+from kink import Container
+
+
+def _run_concurrently(target, threads_count: int = 16) -> None:
+    barrier = Barrier(threads_count)
+
+    def _worker() -> None:
+        barrier.wait()
+        target()
+
+    threads = [Thread(target=_worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_lambda_service_is_constructed_once_under_contention() -> None:
+    constructions: List[object] = []
+
+    def _build_pool(di: Container) -> object:
+        time.sleep(0.01)
+        pool = object()
+        constructions.append(pool)
+        return pool
+
+    container = Container()
+    container["pool"] = lambda di: _build_pool(di)
+    resolved = []
+
+    _run_concurrently(lambda: resolved.append(container["pool"]))
+
+    assert len(constructions) == 1
+    assert all(pool is constructions[0] for pool in resolved)
+
+
+def test_lambda_service_can_resolve_other_lambda_services() -> None:
+    container = Container()
+    container["dsn"] = lambda di: "sqlite://"
+    container["pool"] = lambda di: {"dsn": di["dsn"]}
+    resolved = []
+
+    _run_concurrently(lambda: resolved.append(container["pool"]))
+
+    assert all(pool is resolved[0] for pool in resolved)
+    assert resolved[0] == {"dsn": "sqlite://"}
+
+
+def test_service_replaced_during_construction_is_not_cached() -> None:
+    container = Container()
+
+    def _build(di: Container) -> str:
+        di["service"] = lambda di: "new"
+        return "old"
+
+    container["service"] = lambda di: _build(di)
+
+    assert container["service"] == "old"
+    assert container["service"] == "new"
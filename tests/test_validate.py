@@ -0,0 +1,129 @@
+from typing import List, Optional
+
+import pytest
+
+from kink import Container, DependencyGraph, inject
+from kink.errors import ResolverError
+
+
+class Connection:
+    ...
+
+
+class IPlugin:
+    ...
+
+
+def test_validate_returns_dependency_graph() -> None:
+    container = Container()
+    container[Connection] = lambda di: Connection()
+
+    @inject(container=container, alias=IPlugin)
+    class Plugin:
+        def __init__(self, connection: Optional[Connection]):
+            ...
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection, plugins: List[IPlugin], retries: int = 3):
+            ...
+
+    @inject(container=container)
+    def handler(request: dict, repository: Repository) -> None:
+        ...
+
+    graph = container.validate()
+
+    assert isinstance(graph, DependencyGraph)
+    assert graph.dependencies(Repository) == [Connection, Plugin]
+    assert graph.dependencies(Plugin) == [Connection]
+    assert graph.dependencies("handler") == [Repository]
+    assert graph.dependencies(Connection) == []
+    assert graph.unresolved == {"handler": ("request",)}
+    assert graph.cycles == []
+    order = graph.topological_order()
+    assert order.index(Connection) < order.index(Plugin) < order.index(Repository) < order.index("handler")
+
+
+def test_validate_reports_unresolved_constructor_parameters() -> None:
+    container = Container()
+    container[Connection] = lambda di: Connection()
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection, table: str, schema: str):
+            ...
+
+    with pytest.raises(ResolverError) as error:
+        container.validate()
+
+    assert "`table`, `schema`" in str(error.value)
+    assert container.validate(strict=False).unresolved == {Repository: ("table", "schema")}
+
+
+def test_validate_reports_cycles() -> None:
+    container = Container()
+
+    class A:
+        ...
+
+    class B:
+        ...
+
+    @inject(container=container, alias=A)
+    class AImpl:
+        def __init__(self, b: B):
+            ...
+
+    @inject(container=container, alias=B)
+    class BImpl:
+        def __init__(self, a: A):
+            ...
+
+    with pytest.raises(ResolverError) as error:
+        container.validate()
+
+    assert "Circular dependency" in str(error.value)
+    graph = container.validate(strict=False)
+    assert graph.cycles == [[AImpl, BImpl, AImpl]]
+    with pytest.raises(ResolverError):
+        graph.topological_order()
+
+
+def test_validate_child_container() -> None:
+    parent = Container()
+    parent[Connection] = lambda di: Connection()
+
+    @inject(container=parent)
+    class Repository:
+        def __init__(self, connection: Connection):
+            ...
+
+    child = parent.child()
+    child["tenant"] = "acme"
+
+    @inject(container=child)
+    class TenantService:
+        def __init__(self, repository: Repository, tenant: str):
+            ...
+
+    graph = child.validate()
+
+    assert graph.dependencies(TenantService) == [Repository, "tenant"]
+    assert graph.dependencies(Repository) == [Connection]
+    assert TenantService not in parent.validate().nodes
+
+
+def test_graph_export() -> None:
+    container = Container()
+    container[Connection] = lambda di: Connection()
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection):
+            ...
+
+    graph = container.validate()
+
+    assert graph.to_dict()["edges"] == [["test_graph_export.<locals>.Repository", "Connection"]]
+    assert '"test_graph_export.<locals>.Repository" -> "Connection";' in graph.to_dot()
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+
+from kink import Container, inject
+
+
+class Connection:
+    ...
+
+
+class IPlugin:
+    ...
+
+
+def test_warm_up_creates_memoized_services_in_dependency_order() -> None:
+    created: List[str] = []
+    container = Container()
+    container["dsn"] = "sqlite://"
+    container[Connection] = lambda di: created.append("Connection") or Connection()
+    container.factories["request_id"] = lambda di: created.append("request_id") or 1
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection):
+            created.append("Repository")
+
+    @inject(container=container, alias=IPlugin)
+    class Plugin:
+        def __init__(self, repository: Repository):
+            created.append("Plugin")
+
+    @inject(container=container, use_factory=True)
+    class Handler:
+        def __init__(self, repository: Repository):
+            created.append("Handler")
+
+    timings = container.warm_up()
+
+    assert created == ["Connection", "Repository", "Plugin"]
+    assert [getattr(key, "__name__", key) for key in timings] == ["Connection", "Repository", "Plugin"]
+    assert all(elapsed >= 0 for elapsed in timings.values())
+
+    container[IPlugin]
+
+    assert created == ["Connection", "Repository", "Plugin"]
+
+
+def test_warm_up_selected_services() -> None:
+    created: List[str] = []
+    container = Container()
+    container[Connection] = lambda di: created.append("Connection") or Connection()
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection):
+            created.append("Repository")
+
+    @inject(container=container, alias=IPlugin)
+    class Plugin:
+        def __init__(self, repository: Repository):
+            created.append("Plugin")
+
+    container.warm_up([Connection])
+
+    assert created == ["Connection"]
+
+    created.clear()
+    container.warm_up([IPlugin])
+
+    assert created == ["Repository", "Plugin"]
+
+
+def test_warm_up_skips_created_services() -> None:
+    container = Container()
+    container[Connection] = lambda di: Connection()
+
+    @inject(container=container)
+    class Repository:
+        def __init__(self, connection: Connection):
+            ...
+
+    container[Connection]
+
+    assert list(container.warm_up()) == [Repository]
+    assert container.warm_up() == {}
+
+
+def test_warm_up_independent_services_concurrently() -> None:
+    # independent services complete only when all four of them are being created at the same time
+    barrier = threading.Barrier(4)
+    periods: Dict[str, Tuple[float, float]] = {}
+
+    def _create(name: str) -> str:
+        start = time.perf_counter()
+        if name != "search":
+            barrier.wait(timeout=5)
+        periods[name] = (start, time.perf_counter())
+        return name
+
+    container = Container()
+    for name in ("model", "config", "pool", "index"):
+        container[name] = lambda di, name=name: _create(name)
+
+    @inject(container=container)
+    class Search:
+        def __init__(self, index: str, model: str):
+            _create("search")
+
+    timings = container.warm_up(max_workers=4)
+
+    assert set(timings) == {"model", "config", "pool", "index", Search}
+    assert periods["search"][0] >= max(periods["index"][1], periods["model"][1])
+
+
+def test_concurrent_warm_up_propagates_errors() -> None:
+    container = Container()
+
+    def _fail() -> None:
+        raise RuntimeError("cannot load model")
+
+    container["model"] = lambda di: _fail()
+    container["config"] = lambda di: {}
+
+    with pytest.raises(RuntimeError):
+        container.warm_up(max_workers=2)